@@ -0,0 +1,91 @@
+"""Benchmarks for cognition performance characteristics."""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+from cognition.config import PROJECT_ROOT
+from cognition.formatter import Formatter
+
+# Each step runs in a fresh interpreter so import caches do not hide costs
+STARTUP_STEPS = {
+    "cli import": "import cognition.main",
+    "torch + transformers import": "import torch, transformers",
+    "encoder load": (
+        "from cognition.config import Config\n"
+        "from cognition.search import EmbeddingEncoder\n"
+        "EmbeddingEncoder(Config())"
+    ),
+}
+
+
+def _time_subprocess(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, cwd=PROJECT_ROOT
+    )
+    return time.perf_counter() - start
+
+
+def benchmark_startup(repeat: int = 3) -> dict[str, float]:
+    """Median wall time in seconds of each startup step."""
+    baseline = statistics.median(_time_subprocess("pass") for _ in range(repeat))
+    results = {"interpreter": baseline}
+    for name, code in STARTUP_STEPS.items():
+        results[name] = statistics.median(_time_subprocess(code) for _ in range(repeat))
+    return results
+
+
+def _reference_format_record(record: dict) -> str:
+    """Formatter.format_record as it was before batch formatting."""
+    result = ""
+    result += f"Title: ${record.get('title', 'No Title')}\n"
+    result += "\n"
+    result += "Comments:\n"
+
+    comments = []
+    for comment in record.get("comments", []):
+        comment = comment.strip()
+        comment = re.sub(r"@[^ ]+\s*", "", comment)
+        comment = re.sub("\n", "", comment)
+        comment = comment[1:] if comment and not comment[0].isalnum() else comment
+        if comment:
+            comments.append(comment)
+    result += "\n".join([f"- {comment}" for comment in comments if comment])
+    return result
+
+
+def benchmark_formatter(
+    records: list[dict], repeat: int = 3, max_tokens: int = 512
+) -> dict[str, float]:
+    """Records per second of the reference and batch formatting paths."""
+    formatter = Formatter()
+    expected = [_reference_format_record(record) for record in records]
+    if formatter.format_records(records, processes=1) != expected:
+        raise AssertionError("Batch formatting differs from the reference output")
+
+    variants = {
+        "reference (per record)": lambda: [
+            _reference_format_record(record) for record in records
+        ],
+        "batch": lambda: formatter.format_records(records, processes=1),
+        "batch, token budget": lambda: formatter.format_records(
+            records, max_tokens=max_tokens, processes=1
+        ),
+        "batch, parallel": lambda: formatter.format_records(
+            records, processes=os.cpu_count()
+        ),
+    }
+
+    results = {}
+    for name, run in variants.items():
+        seconds = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            seconds.append(time.perf_counter() - start)
+        results[name] = len(records) / statistics.median(seconds)
+    return results
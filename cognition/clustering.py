@@ -0,0 +1,176 @@
+"""Incremental topic clustering of stored embeddings."""
+
+import os
+
+import numpy as np
+
+from cognition.store import EmbeddingStore
+
+
+class TopicClusterer:
+    """Spherical mini-batch k-means with persisted centroids.
+
+    Each mini-batch is assigned to the nearest centroids in one matrix
+    multiply, then centroids move towards their members with a per-cluster
+    learning rate of ``1 / count``. Work per update is proportional to the
+    size of the batch, not to the number of records seen so far, and the
+    saved state does not grow with the corpus. The ``num_representatives``
+    records closest to each centroid are kept to describe the topic.
+    """
+
+    def __init__(
+        self,
+        n_clusters: int,
+        num_representatives: int = 5,
+        seed: int = 0,
+        generation: str = "",
+    ):
+        self.n_clusters = n_clusters
+        self.num_representatives = num_representatives
+        self.seed = seed
+        self.generation = generation
+        self.centroids: np.ndarray | None = None
+        self.counts = np.zeros(n_clusters, dtype=np.int64)
+        self.rep_keys = np.full((n_clusters, num_representatives), "", dtype=object)
+        self.rep_counts = np.zeros(n_clusters, dtype=np.int64)
+        self.rep_vectors: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        """Number of records assigned so far."""
+        return int(self.counts.sum())
+
+    @classmethod
+    def load(
+        cls,
+        file_path: str,
+        store: EmbeddingStore,
+        n_clusters: int,
+        num_representatives: int = 5,
+    ) -> "TopicClusterer":
+        """Load a saved clusterer, starting fresh if it does not match ``store``.
+
+        State is discarded when it is missing, shaped differently or was
+        built from a store that has since been recreated.
+        """
+        clusterer = cls(n_clusters, num_representatives, generation=store.generation)
+        if not os.path.exists(file_path):
+            return clusterer
+
+        data = np.load(file_path)
+        shape = (n_clusters, num_representatives)
+        if data["rep_vectors"].shape[:2] != shape or not store.matches(
+            str(data["generation"]), int(data["counts"].sum())
+        ):
+            return clusterer
+
+        clusterer.centroids = data["centroids"]
+        clusterer.counts = data["counts"]
+        clusterer.rep_keys = data["rep_keys"].astype(object)
+        clusterer.rep_counts = data["rep_counts"]
+        clusterer.rep_vectors = data["rep_vectors"]
+        return clusterer
+
+    def save(self, file_path: str):
+        with open(file_path, "wb") as f:
+            np.savez(
+                f,
+                generation=np.array(self.generation),
+                centroids=self.centroids,
+                counts=self.counts,
+                rep_keys=self.rep_keys.astype(str),
+                rep_counts=self.rep_counts,
+                rep_vectors=self.rep_vectors,
+            )
+
+    def _init_centroids(self, vectors: np.ndarray):
+        """Pick initial centroids with k-means++ seeding on cosine distance."""
+        if len(vectors) < self.n_clusters:
+            raise ValueError(
+                f"Need at least {self.n_clusters} records to initialise clustering, "
+                f"got {len(vectors)}"
+            )
+
+        rng = np.random.default_rng(self.seed)
+        chosen = [int(rng.integers(len(vectors)))]
+        distances = np.clip(1.0 - vectors @ vectors[chosen[0]], 0.0, None)
+        for _ in range(1, self.n_clusters):
+            total = distances.sum()
+            probs = distances / total if total > 0 else None
+            chosen.append(int(rng.choice(len(vectors), p=probs)))
+            distances = np.minimum(
+                distances, np.clip(1.0 - vectors @ vectors[chosen[-1]], 0.0, None)
+            )
+
+        self.centroids = vectors[chosen].copy()
+        self.rep_vectors = np.zeros(
+            (self.n_clusters, self.num_representatives, vectors.shape[1]),
+            dtype=np.float32,
+        )
+
+    def predict(self, vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the nearest cluster and its cosine similarity for each vector."""
+        scores = vectors @ self.centroids.T
+        labels = scores.argmax(axis=1).astype(np.int32)
+        return labels, scores[np.arange(len(vectors)), labels]
+
+    def partial_fit(self, vectors: np.ndarray, keys: list[str]) -> np.ndarray:
+        """Assign a mini-batch, move the centroids and return the labels."""
+        if self.centroids is None:
+            self._init_centroids(vectors)
+
+        labels, _ = self.predict(vectors)
+
+        # Per-cluster running mean: c <- c + (sum(x) - n * c) / count
+        batch_counts = np.bincount(labels, minlength=self.n_clusters)
+        sums = np.zeros_like(self.centroids)
+        np.add.at(sums, labels, vectors)
+        self.counts += batch_counts
+        updated = batch_counts > 0
+        self.centroids[updated] += (
+            sums[updated] - batch_counts[updated, None] * self.centroids[updated]
+        ) / self.counts[updated, None]
+        self.centroids /= np.clip(
+            np.linalg.norm(self.centroids, axis=1, keepdims=True), 1e-9, None
+        )
+
+        self._update_representatives(vectors, keys, labels)
+        return labels
+
+    def _update_representatives(
+        self, vectors: np.ndarray, keys: list[str], labels: np.ndarray
+    ):
+        """Keep the records closest to each (moved) centroid."""
+        keys = np.asarray(keys, dtype=object)
+        for cluster in np.unique(labels):
+            members = np.nonzero(labels == cluster)[0]
+            known = self.rep_counts[cluster]
+            candidate_keys = np.concatenate(
+                [self.rep_keys[cluster, :known], keys[members]]
+            )
+            candidate_vectors = np.concatenate(
+                [self.rep_vectors[cluster, :known], vectors[members]]
+            )
+
+            scores = candidate_vectors @ self.centroids[cluster]
+            best = np.argsort(-scores)[: self.num_representatives]
+            self.rep_keys[cluster, : len(best)] = candidate_keys[best]
+            self.rep_vectors[cluster, : len(best)] = candidate_vectors[best]
+            self.rep_counts[cluster] = len(best)
+
+    def representatives(self) -> dict[int, list[dict]]:
+        """Representative records per cluster, closest to the centroid first."""
+        topics = {}
+        if self.centroids is None:
+            return topics
+        for cluster in range(self.n_clusters):
+            known = self.rep_counts[cluster]
+            scores = self.rep_vectors[cluster, :known] @ self.centroids[cluster]
+            order = np.argsort(-scores)
+            topics[cluster] = [
+                {
+                    "id": self.rep_keys[cluster, i],
+                    "score": round(float(scores[i]), 4),
+                }
+                for i in order
+            ]
+        return topics
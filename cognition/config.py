@@ -1,8 +1,30 @@
 import os
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 class Config:
     def __init__(self):
         self.model_name: str = os.getenv(
             "COGNITION_MODEL_NAME", "allegro/herbert-base-cased"
         )
+        self.model_cache_dir: str = os.getenv("COGNITION_MODEL_CACHE_DIR", "tmp/models")
+        self.index_path: str = os.getenv("COGNITION_INDEX_PATH", "tmp/index")
+        self.embedding_dtype: str = os.getenv("COGNITION_EMBEDDING_DTYPE", "int8")
+        self.rescore_candidates: int = int(
+            os.getenv("COGNITION_RESCORE_CANDIDATES", "100")
+        )
+        self.related_path: str = os.getenv(
+            "COGNITION_RELATED_PATH", "tmp/related_posts.json"
+        )
+        self.topics_path: str = os.getenv("COGNITION_TOPICS_PATH", "tmp/topics.json")
+        self.fast_model_name: str = os.getenv(
+            "COGNITION_FAST_MODEL_NAME",
+            "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+        )
+        self.fast_index_path: str = os.getenv(
+            "COGNITION_FAST_INDEX_PATH", "tmp/index_fast"
+        )
+        self.cascade_candidates: int = int(
+            os.getenv("COGNITION_CASCADE_CANDIDATES", "200")
+        )
@@ -1,25 +1,65 @@
+import os
 import re
+from functools import partial
+from multiprocessing import Pool
+
+# Mentions and newlines removed in a single pass
+_CLEAN_PATTERN = re.compile(r"@[^ ]+\s*|\n")
+
+# Generous estimate of characters per token (not a hard bound), so text
+# past the budget would almost certainly be cut by the tokenizer anyway
+MAX_CHARS_PER_TOKEN = 8
 
 
 class Formatter:
-    def format_record(self, record: dict) -> str:
-        result = ""
-        result += f"Title: ${record.get('title', 'No Title')}\n"
-        result += "\n"
-        result += "Comments:\n"
-
-        comments = [
-            clean
-            for comment in record.get("comments", [])
-            if (clean := self._clean_comment(comment))
-        ]
-        result += "\n".join([f"- {comment}" for comment in comments if comment])
-        return result
+    # Below this many records, process startup costs more than it saves
+    PARALLEL_THRESHOLD = 20000
+
+    def format_record(self, record: dict, max_chars: int | None = None) -> str:
+        """Format a record; text past ``max_chars`` is not built at all."""
+        header = f"Title: ${record.get('title', 'No Title')}\n\nComments:\n"
+
+        comments = []
+        length = len(header)
+        for comment in record.get("comments", []):
+            if max_chars is not None and length >= max_chars:
+                break
+            if clean := self._clean_comment(comment):
+                if max_chars is not None:
+                    # The comment crossing the budget is cut to fit it
+                    clean = clean[: max_chars - length - 3]
+                    if not clean:
+                        break
+                comments.append(f"- {clean}")
+                length += len(clean) + 3
+        return header + "\n".join(comments)
+
+    def format_records(
+        self,
+        records: list[dict],
+        max_tokens: int | None = None,
+        processes: int | None = None,
+        chunksize: int = 1000,
+    ) -> list[str]:
+        """Format many records, in parallel processes for large corpora.
+
+        With ``max_tokens`` set, comments past the tokenizer budget are not
+        cleaned or joined at all. ``processes`` defaults to all CPUs once
+        there are at least ``PARALLEL_THRESHOLD`` records.
+        """
+        max_chars = max_tokens * MAX_CHARS_PER_TOKEN if max_tokens else None
+        format_record = partial(self.format_record, max_chars=max_chars)
+
+        if processes is None and len(records) >= self.PARALLEL_THRESHOLD:
+            processes = os.cpu_count() or 1
+        if processes is None or processes <= 1:
+            return [format_record(record) for record in records]
+
+        with Pool(processes) as pool:
+            return pool.map(format_record, records, chunksize=chunksize)
 
     def _clean_comment(self, comment: str) -> str | None:
         """Clean and format a single comment."""
-        comment = comment.strip()
-        comment = re.sub(r"@[^ ]+\s*", "", comment)  # Remove mentions
-        comment = re.sub("\n", "", comment)  # Remove mentions
+        comment = _CLEAN_PATTERN.sub("", comment.strip())  # Remove mentions, newlines
         comment = comment[1:] if comment and not comment[0].isalnum() else comment
         return comment if comment else None
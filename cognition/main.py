@@ -1,111 +1,502 @@
+import argparse
+import json
 import os
 import sys
+import time
 
-import torch.nn.functional as F
-
-from cognition.formatter import Formatter
+from cognition.benchmark import benchmark_formatter, benchmark_startup
+from cognition.clustering import TopicClusterer
+from cognition.formatter import MAX_CHARS_PER_TOKEN, Formatter
+from cognition.models import preload_model
 from cognition.parser import Parser
-from cognition.search import EmbeddingEncoder
+from cognition.pipeline import StreamingPipeline
+from cognition.search import MAX_LENGTH, EmbeddingEncoder, RetrievalCascade
+from cognition.similarity import Neighbours, Pairs, SimilarityJoin, save_related_table
+from cognition.store import EmbeddingStore, QueryCache
 
-from .config import Config
+from .config import PROJECT_ROOT, Config
 
+DEFAULT_INPUT = os.path.join(PROJECT_ROOT, "tmp", "20250731_212553_microblog.json")
 
-def main():
-    # Initialize configuration and components
-    # Config: Holds model settings (model name, device preferences, etc.)
+
+def build_index(
+    config: Config,
+    texts: list[dict],
+    formatter: Formatter,
+    index_path: str,
+    model_name: str | None = None,
+    store: EmbeddingStore | None = None,
+) -> tuple[EmbeddingStore, EmbeddingEncoder]:
+    # Records are appended to ``store`` when given, otherwise the index at
+    # ``index_path`` is (re)created from them. Returns the index and the
+    # encoder, which is only loaded once the records have been formatted
+
+    # STEP 2: FORMAT FOR EMBEDDING
+    # Convert structured records into natural language text
+    # This combines title, description, and comments into coherent passages
+    # Example: "Title: [post title]\nContent: [description]\nComments: [comment1, comment2...]"
+    # Comments past the encoder's token budget are skipped, not formatted
+    # Formatting runs first: its process pool should not fork a process that
+    # already holds torch and the model
+    inputs = formatter.format_records(texts, max_tokens=MAX_LENGTH)
+    encoder = EmbeddingEncoder(config, model_name=model_name)
+
+    # STEP 3: GENERATE DOCUMENT EMBEDDINGS
+    # Transform each formatted text into a dense vector representation
+    # Uses transformer model (e.g., BERT) to capture semantic meaning
+    # Output shape: [num_documents, embedding_dimension] (e.g., [1000, 768])
+    # Each row is a high-dimensional vector representing one document's meaning
+    inputs_embedding = encoder.encode(inputs)
+
+    # STEP 4: STORE EMBEDDINGS IN REDUCED PRECISION
+    # Write the embeddings to a memory-mapped store as int8 (or float16)
+    # This cuts memory 2-4x and lets many processes share the same index
+    # The float32 copy stays on disk and is only read to rescore candidates
+    if store is None:
+        store = EmbeddingStore.create(
+            index_path,
+            dim=inputs_embedding.shape[1],
+            dtype=config.embedding_dtype,
+            keep_fp32=config.rescore_candidates > 0,
+        )
+    # Records are stored with the vectors so results can be shown later
+    # without re-reading the snapshot
+    store.append(
+        inputs_embedding,
+        keys=[str(item.get("id", "")) for item in texts],
+        records=texts,
+    )
+    return store, encoder
+
+
+def build_cascade(
+    config: Config, texts: list[dict], formatter: Formatter, reindex: bool
+) -> RetrievalCascade:
+    # The fast encoder indexes the whole corpus in its own store, the base
+    # model is only used at query time to re-rank the top candidates
+    fast_encoder = None
+    fast_index_path = os.path.join(PROJECT_ROOT, config.fast_index_path)
+    rebuild = reindex or not EmbeddingStore.exists(fast_index_path)
+    store = None if rebuild else EmbeddingStore(fast_index_path)
+
+    # Without a snapshot, the fast index is built from the records stored in
+    # the base index, and catches up with records the pipeline streamed
+    # into it since the previous search
+    index_path = os.path.join(PROJECT_ROOT, config.index_path)
+    if not texts and EmbeddingStore.exists(index_path):
+        indexed = set() if store is None else set(store.keys)
+        texts = stored_records(EmbeddingStore(index_path), exclude_keys=indexed)
+        if texts and store is not None:
+            print(f"Adding {len(texts)} new records to the fast index")
+
+    if rebuild and not texts:
+        raise ValueError(
+            "No records to build the fast index from; pass --input or run the "
+            "pipeline first"
+        )
+    if texts:
+        store, fast_encoder = build_index(
+            config,
+            texts,
+            formatter,
+            fast_index_path,
+            model_name=config.fast_model_name,
+            store=store,
+        )
+
+    # Candidate documents are formatted on first use instead of formatting
+    # the whole corpus up front; records come from the store, or from the
+    # snapshot for indexes built before records were stored
+    records = {str(item.get("id", "")): item for item in texts}
+    max_chars = MAX_LENGTH * MAX_CHARS_PER_TOKEN
+
+    def document(row: int) -> str | None:
+        record = store.record(row) or records.get(store.keys[row])
+        return formatter.format_record(record, max_chars=max_chars) if record else None
+
+    return RetrievalCascade(
+        fast_encoder or EmbeddingEncoder(config, model_name=config.fast_model_name),
+        EmbeddingEncoder(config),
+        store,
+        document,
+        candidates=config.cascade_candidates,
+        rescore=config.rescore_candidates,
+    )
+
+
+def stored_records(store: EmbeddingStore, exclude_keys: set[str]) -> list[dict]:
+    """Records kept in ``store`` whose keys are not in ``exclude_keys``."""
+    records = []
+    for row, key in enumerate(store.keys):
+        if key not in exclude_keys and (record := store.record(row)) is not None:
+            records.append(record)
+    return records
+
+
+def warn_missing_documents(cascade: RetrievalCascade):
+    if cascade.missing:
+        print(
+            f"Warning: skipped {len(cascade.missing)} candidates without a stored "
+            "record or snapshot entry; rebuild the index with --reindex"
+        )
+
+
+def run_search(config: Config, args: argparse.Namespace):
+    # Initialize components
     # Parser: Converts JSON data into structured Record objects
     # Formatter: Transforms records into text suitable for embedding
     # Encoder: Generates semantic embeddings from text using transformer models
-    config = Config()
+    #          (created lazily, so cached-only queries never import torch)
     parser = Parser()
     formatter = Formatter()
-    encoder = EmbeddingEncoder(config)
-
-    try:
-        print(f"Using model: {config.model_name}")
-
-        # STEP 1: LOAD AND PARSE DATA
-        # Construct path to the microblog JSON file containing forum posts
-        # This file contains structured data with posts, comments, metadata
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        sample_file_path = os.path.join(
-            project_root, "tmp", "20250731_212553_microblog.json"
-        )
+    encoder = None
 
-        # Parse JSON file into Record objects with structured fields
-        # Each record contains: id, title, description, source, type, created_at, comments
-        texts = parser.parse(sample_file_path)
+    print(f"Using model: {config.model_name}")
 
-        # STEP 2: FORMAT FOR EMBEDDING
-        # Convert structured records into natural language text
-        # This combines title, description, and comments into coherent passages
-        # Example: "Title: [post title]\nContent: [description]\nComments: [comment1, comment2...]"
-        inputs = [formatter.format_record(item) for item in texts]
+    # STEP 1: LOAD AND PARSE DATA
+    # Read the JSON file written by the fetcher (microblog snapshot by default)
+    # This file contains structured data with posts, comments, metadata
+    # Parse JSON file into Record objects with structured fields
+    # Each record contains: id, title, description, source, type, created_at, comments
+    # Only needed to (re)build the index, which stores the records it was
+    # built from, so an index filled by the pipeline needs no snapshot
+    index_path = os.path.join(
+        PROJECT_ROOT, config.fast_index_path if args.cascade else config.index_path
+    )
+    # The cascade can fall back to the records stored in the base index
+    texts = []
+    if args.reindex or not EmbeddingStore.exists(index_path):
+        if not args.cascade or os.path.exists(args.input):
+            texts = parser.parse(args.input)
 
-        # STEP 3: GENERATE DOCUMENT EMBEDDINGS
-        # Transform each formatted text into a dense vector representation
-        # Uses transformer model (e.g., BERT) to capture semantic meaning
-        # Output shape: [num_documents, embedding_dimension] (e.g., [1000, 768])
-        # Each row is a high-dimensional vector representing one document's meaning
-        inputs_embedding = encoder.encode(inputs)
+    if args.cascade:
+        # STEPS 2-6 AS A TWO-STAGE CASCADE
+        # Candidates come from the fast model's index, then the base model
+        # re-ranks only those candidates
+        print(f"Candidate model: {config.fast_model_name}")
+        cascade = build_cascade(config, texts, formatter, args.reindex)
+        store = cascade.store
+        ranked, timings = cascade.search(args.query, top_k=10)
+        warn_missing_documents(cascade)
+        print(
+            f"Stage latencies: candidates {timings['candidates']:.3f}s, "
+            f"rerank {timings['rerank']:.3f}s"
+        )
+    else:
+        if args.reindex or not EmbeddingStore.exists(index_path):
+            store, encoder = build_index(config, texts, formatter, index_path)
+        else:
+            # Reuse the existing index; use --reindex after fetching new data
+            store = EmbeddingStore(index_path)
 
-        # STEP 4: GENERATE QUERY EMBEDDING
+        # STEP 5: GENERATE QUERY EMBEDDING
         # Convert search query into same embedding space as documents
         # Must use identical model and processing to ensure compatibility
+        # Repeated queries are served from the cache without loading the model
         # Output shape: [1, embedding_dimension] (e.g., [1, 768])
-        query_embedding = encoder.encode("Biznes")
-
-        # STEP 5: COMPUTE SEMANTIC SIMILARITY
-        # Calculate cosine similarity between query and all documents
-        #
-        # WHY COSINE SIMILARITY?
-        # =====================
-        # 1. SEMANTIC RELEVANCE: Measures angle between vectors, not magnitude
-        #    - Documents of different lengths get fair comparison
-        #    - Focuses on semantic direction rather than vector size
-        #
-        # 2. NORMALIZED COMPARISON: Range is always [-1, 1]
-        #    - 1.0 = identical semantic meaning (parallel vectors)
-        #    - 0.0 = no semantic relationship (orthogonal vectors)
-        #    - -1.0 = opposite meaning (antiparallel vectors)
-        #
-        # 3. LENGTH INVARIANCE: Short and long documents compared fairly
-        #    - "Business" vs "Business is important for economy"
-        #    - Both could have similar cosine similarity to query "Biznes"
-        #    - Euclidean distance would unfairly penalize longer text
-        #
-        # 4. EFFICIENT COMPUTATION: Simple dot product after normalization
-        #    - Our embeddings are already normalized (unit vectors)
-        #    - cosine(A,B) = A·B when ||A|| = ||B|| = 1
-        #
-        # 5. PROVEN EFFECTIVENESS: Standard in information retrieval
-        #    - Works well with transformer embeddings
-        #    - Handles high-dimensional sparse spaces effectively
-        similarities = F.cosine_similarity(query_embedding, inputs_embedding)
-
-        # STEP 6: RANK RESULTS BY RELEVANCE
-        # Sort documents by similarity score in descending order
-        # Higher scores = more semantically similar to query
-        # zip() pairs each document with its similarity score
-        # key=lambda extracts score for sorting, reverse=True for descending order
-        results = sorted(
-            zip(inputs, similarities), key=lambda x: float(x[1]), reverse=True
+        query_cache = QueryCache(
+            os.path.join(index_path, "queries.npz"), config.model_name
+        )
+        query_embedding = query_cache.get(args.query)
+        if query_embedding is None:
+            encoder = encoder or EmbeddingEncoder(config)
+            query_embedding = encoder.encode(args.query)
+            query_cache.put(args.query, query_embedding)
+
+        # STEP 6: COMPUTE SEMANTIC SIMILARITY AND RANK RESULTS
+        # Embeddings are normalized, so cosine similarity is a plain dot product
+        # - Scores are computed directly on the quantized vectors
+        # - The best candidates are rescored with full-precision vectors
+        # - Results come back sorted by score in descending order
+        ranked = store.search(
+            query_embedding, top_k=10, rescore=config.rescore_candidates
         )
 
-        # STEP 7: DISPLAY TOP RESULTS
-        # Show the 10 most relevant documents with their similarity scores
-        # Provides visual feedback on search quality and ranking confidence
-        print("\nTop 10 search results:")
-        for i, (doc, score) in enumerate(results[:10], 1):
-            print(f"\n{'-' * 40}")
-            print(f"Result #{i} | Score: {score:.4f}")  # 4 decimal precision
-            print(f"{'-' * 40}")
-            print(f"{doc}")
+    # Only the returned records are formatted for display; indexes built
+    # before records were stored fall back to the snapshot
+    documents = [store.record(idx) for idx, _ in ranked]
+    if None in documents and not texts and os.path.exists(args.input):
+        texts = parser.parse(args.input)
+    records = {str(item.get("id", "")): item for item in texts}
+    results = [
+        (formatter.format_record(doc or records.get(store.keys[idx], {})), score)
+        for doc, (idx, score) in zip(documents, ranked)
+    ]
+
+    # STEP 7: DISPLAY TOP RESULTS
+    # Show the 10 most relevant documents with their similarity scores
+    # Provides visual feedback on search quality and ranking confidence
+    print("\nTop 10 search results:")
+    for i, (doc, score) in enumerate(results[:10], 1):
+        print(f"\n{'-' * 40}")
+        print(f"Result #{i} | Score: {score:.4f}")  # 4 decimal precision
+        print(f"{'-' * 40}")
+        print(f"{doc}")
+
+    print("\nDONE")
+
 
-        print("\nDONE")
+def run_related(config: Config, args: argparse.Namespace):
+    # STEP 1: OPEN THE EMBEDDING STORE
+    # Reuses the embeddings written by the search command, no model needed
+    index_path = os.path.join(PROJECT_ROOT, config.index_path)
+    store = EmbeddingStore(index_path)
+    join = SimilarityJoin(store, workers=args.workers)
+    keys = store.keys
 
+    # Join state is saved next to the index and tied to the store's
+    # generation, so only records added since the previous run are scored,
+    # and a rebuilt index starts from scratch
+    if args.threshold is not None:
+        # STEP 2a: INCREMENTAL THRESHOLD JOIN
+        # Collect every pair scoring at least the threshold, in both directions
+        pairs_path = os.path.join(index_path, "related_pairs.npz")
+        pairs = Pairs.load(pairs_path, args.threshold, store)
+        print(f"Scoring pairs for {len(store) - pairs.count} new records")
+        pairs = join.threshold_pairs(args.threshold, pairs)
+        pairs.save(pairs_path)
+        table = pairs.to_table(keys)
+    else:
+        # STEP 2b: INCREMENTAL TOP-K JOIN
+        neighbours_path = os.path.join(index_path, "related.npz")
+        neighbours = Neighbours.load(neighbours_path, args.k, store)
+        print(f"Updating neighbours for {len(store) - len(neighbours)} new records")
+        neighbours = join.top_k(args.k, neighbours)
+        neighbours.save(neighbours_path)
+        table = neighbours.to_table(keys, min_score=args.min_score)
+
+    # STEP 3: WRITE THE RELATED-POSTS TABLE
+    # The threshold table goes to its own file, so neither mode overwrites
+    # the table of the other
+    related_path = os.path.join(PROJECT_ROOT, config.related_path)
+    if args.threshold is not None:
+        related_path = os.path.splitext(related_path)[0] + "_threshold.json"
+    save_related_table(related_path, table)
+    print(f"Saved related posts for {len(table)} records to {related_path}")
+
+
+def run_topics(config: Config, args: argparse.Namespace):
+    # STEP 1: LOAD INDEX AND CLUSTER STATE
+    # Centroids are saved next to the index; only records added since the
+    # previous run are clustered, so cost follows new data, not corpus size.
+    # State from before a --reindex is discarded and clustering starts over
+    index_path = os.path.join(PROJECT_ROOT, config.index_path)
+    store = EmbeddingStore(index_path)
+    state_path = os.path.join(index_path, "topics.npz")
+    clusterer = TopicClusterer.load(
+        state_path, store, args.clusters, args.representatives
+    )
+    start = len(clusterer)
+    print(f"Clustering {len(store) - start} new records into {args.clusters} topics")
+
+    # STEP 2: MINI-BATCH UPDATES
+    # Each batch is assigned in one matrix multiply and nudges the centroids
+    new_labels = []
+    for batch_start in range(start, len(store), args.batch_size):
+        batch_stop = min(batch_start + args.batch_size, len(store))
+        new_labels.extend(
+            clusterer.partial_fit(
+                store.vectors(batch_start, batch_stop),
+                store.keys[batch_start:batch_stop],
+            ).tolist()
+        )
+    if clusterer.centroids is None:
+        print("No records to cluster")
+        return
+
+    # STEP 3: WRITE ASSIGNMENTS AND TOPIC SUMMARY
+    # Assignments for new records are appended, topics are rewritten
+    topics_path = os.path.join(PROJECT_ROOT, config.topics_path)
+    assignments_path = os.path.splitext(topics_path)[0] + "_assignments.jsonl"
+    os.makedirs(os.path.dirname(topics_path), exist_ok=True)
+    with open(assignments_path, "a" if start else "w", encoding="utf-8") as f:
+        for key, label in zip(store.keys[start:], new_labels):
+            f.write(json.dumps({"id": key, "topic": label}) + "\n")
+
+    topics = {
+        cluster: {"size": int(clusterer.counts[cluster]), "representatives": reps}
+        for cluster, reps in clusterer.representatives().items()
+    }
+    with open(topics_path, "w", encoding="utf-8") as f:
+        json.dump(topics, f, indent=2, ensure_ascii=False)
+
+    clusterer.save(state_path)
+    print(f"Saved {len(topics)} topics to {topics_path}")
+
+
+def run_pipeline(config: Config, args: argparse.Namespace):
+    # The fetcher pulls in httpx and pydantic, which only this command needs
+    from fetcher.config import Config as FetcherConfig
+    from fetcher.services import ForumService
+
+    fetcher_config = FetcherConfig()
+    if not fetcher_config.validate():
+        raise ValueError(
+            "Missing API configuration (API_BASE_URL, API_KEY, API_SECRET)"
+        )
+
+    # Fetch, format, embed and index run concurrently; each micro-batch is
+    # searchable as soon as it is appended to the index
+    index_path = os.path.join(PROJECT_ROOT, config.index_path)
+    pipeline = StreamingPipeline(
+        ForumService(fetcher_config),
+        Formatter(),
+        EmbeddingEncoder(config),
+        config,
+        index_path,
+        source=args.source,
+        limit=args.limit or fetcher_config.max_records,
+        interval=args.interval,
+        batch_size=args.batch_size,
+        max_wait=args.max_wait,
+        queue_size=args.queue_size,
+    )
+    counts = pipeline.run()
+    print(f"Indexed {counts['indexed']} of {counts['fetched']} fetched records")
+
+
+def run_preload(config: Config, args: argparse.Namespace):
+    # Download the models once and keep them locally as safetensors, so later
+    # runs load them through a memory map instead of hitting the network
+    for model_name in (config.model_name, config.fast_model_name):
+        start = time.perf_counter()
+        path = preload_model(config, model_name)
+        print(f"Saved {model_name} to {path} in {time.perf_counter() - start:.1f}s")
+
+
+def run_benchmark(config: Config, args: argparse.Namespace):
+    if args.target == "cascade":
+        # Compare the cascade with single-stage search over the base index,
+        # which must already exist (run `cognition search --reindex` first).
+        # The snapshot is only read when the fast index has to be built
+        texts = []
+        fast_index_path = os.path.join(PROJECT_ROOT, config.fast_index_path)
+        if not EmbeddingStore.exists(fast_index_path) and os.path.exists(args.input):
+            texts = Parser().parse(args.input)
+        cascade = build_cascade(config, texts, Formatter(), reindex=False)
+        baseline_store = EmbeddingStore(os.path.join(PROJECT_ROOT, config.index_path))
+        report = cascade.evaluate(args.query or ["Biznes"], baseline_store)
+        warn_missing_documents(cascade)
+        print(f"Cascade vs single-stage ({len(args.query or ['Biznes'])} queries):")
+        print(f"  recall@10                      {report['recall']:8.3f}")
+        print(f"  single-stage latency           {report['baseline']:8.3f}s")
+        print(f"  stage 1 (candidates) latency   {report['candidates']:8.3f}s")
+        print(f"  stage 2 (rerank) latency       {report['rerank']:8.3f}s")
+        return
+
+    if args.target == "format":
+        texts = Parser().parse(args.input)
+        # Repeat the snapshot so the parallel path has enough work to amortize
+        records = texts * max(1, args.records // max(len(texts), 1))
+        print(f"Formatter throughput on {len(records)} records:")
+        for variant, rate in benchmark_formatter(records, args.repeat).items():
+            print(f"  {variant:<30} {rate:12.0f} records/s")
+        return
+
+    print(f"Startup benchmark (median of {args.repeat} runs):")
+    for step, seconds in benchmark_startup(args.repeat).items():
+        print(f"  {step:<30} {seconds:8.3f}s")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(
+        prog="cognition", description="Semantic analysis of fetched forum data."
+    )
+    subparsers = arg_parser.add_subparsers(dest="command")
+    arg_parser.set_defaults(
+        command="search",
+        query="Biznes",
+        input=DEFAULT_INPUT,
+        reindex=False,
+        cascade=False,
+    )
+
+    search_parser = subparsers.add_parser(
+        "search", help="Index a fetcher snapshot and run a semantic query"
+    )
+    search_parser.add_argument("query", nargs="?", default="Biznes")
+    search_parser.add_argument("--input", default=DEFAULT_INPUT)
+    search_parser.add_argument(
+        "--reindex", action="store_true", help="Rebuild the index from --input"
+    )
+    search_parser.add_argument(
+        "--cascade",
+        action="store_true",
+        help="Retrieve candidates with the fast model, re-rank with the base model",
+    )
+
+    related_parser = subparsers.add_parser(
+        "related", help="Build the related-posts table from the index"
+    )
+    related_parser.add_argument("--k", type=int, default=10)
+    related_parser.add_argument("--min-score", type=float, default=None)
+    related_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=None,
+        help="Return all pairs above this score instead of top-k neighbours",
+    )
+    related_parser.add_argument("--workers", type=int, default=None)
+
+    topics_parser = subparsers.add_parser(
+        "topics", help="Incrementally cluster indexed records into topics"
+    )
+    topics_parser.add_argument("--clusters", type=int, default=50)
+    topics_parser.add_argument("--representatives", type=int, default=5)
+    topics_parser.add_argument("--batch-size", type=int, default=1024)
+
+    pipeline_parser = subparsers.add_parser(
+        "pipeline", help="Stream records from the forum API straight into the index"
+    )
+    pipeline_parser.add_argument(
+        "--source", choices=StreamingPipeline.SOURCES, default="entries"
+    )
+    pipeline_parser.add_argument(
+        "--limit", type=int, default=None, help="Records per pass (MAX_RECORDS)"
+    )
+    pipeline_parser.add_argument(
+        "--interval",
+        type=float,
+        default=0,
+        help="Seconds between polls for new records, 0 for a single pass",
+    )
+    pipeline_parser.add_argument("--batch-size", type=int, default=32)
+    pipeline_parser.add_argument("--max-wait", type=float, default=2.0)
+    pipeline_parser.add_argument("--queue-size", type=int, default=256)
+
+    subparsers.add_parser(
+        "preload", help="Download the model and save it locally as safetensors"
+    )
+
+    benchmark_parser = subparsers.add_parser(
+        "benchmark", help="Measure startup, cascade or formatter performance"
+    )
+    benchmark_parser.add_argument(
+        "target", nargs="?", choices=["startup", "cascade", "format"], default="startup"
+    )
+    benchmark_parser.add_argument("--repeat", type=int, default=3)
+    benchmark_parser.add_argument("--input", default=DEFAULT_INPUT)
+    benchmark_parser.add_argument(
+        "--query", action="append", help="Query for the cascade benchmark"
+    )
+    benchmark_parser.add_argument(
+        "--records", type=int, default=100000, help="Corpus size for format"
+    )
+
+    args = arg_parser.parse_args()
+    config = Config()
+    commands = {
+        "search": run_search,
+        "related": run_related,
+        "topics": run_topics,
+        "pipeline": run_pipeline,
+        "preload": run_preload,
+        "benchmark": run_benchmark,
+    }
+
+    try:
+        commands[args.command](config, args)
     except Exception as e:
-        # STEP 8: ERROR HANDLING
         # Catch and display any errors during processing
         # Common issues: file not found, CUDA memory errors, model loading failures
         print(f"Error: {e}")
@@ -1,15 +1,52 @@
 """Data models for semantic search and classification."""
 
-import torch
-from transformers import AutoModel, AutoModelForMaskedLM, AutoTokenizer
-from transformers.modeling_utils import PreTrainedModel
-from transformers.tokenization_utils_base import PreTrainedTokenizerBase
+import os
+from typing import TYPE_CHECKING
 
-from cognition.config import Config
+from cognition.config import PROJECT_ROOT, Config
 
+if TYPE_CHECKING:
+    from transformers.modeling_utils import PreTrainedModel
+    from transformers.tokenization_utils_base import PreTrainedTokenizerBase
 
-def build_tokenizer(config: Config) -> PreTrainedTokenizerBase:
+
+def local_model_path(config: Config, model_name: str | None = None) -> str:
+    """Return the directory where preloaded model artifacts are stored."""
+    model_name = model_name or config.model_name
+    return os.path.join(
+        PROJECT_ROOT, config.model_cache_dir, model_name.replace("/", "--")
+    )
+
+
+def resolve_model_path(config: Config, model_name: str | None = None) -> str:
+    """Prefer preloaded local artifacts over downloading from the hub."""
+    path = local_model_path(config, model_name)
+    if os.path.exists(os.path.join(path, "config.json")):
+        return path
+    return model_name or config.model_name
+
+
+def preload_model(config: Config, model_name: str | None = None) -> str:
+    """Download the encoder and save it locally as safetensors."""
+    from transformers import AutoModel, AutoTokenizer
+
+    model_name = model_name or config.model_name
+    path = local_model_path(config, model_name)
+    try:
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(path)
+        AutoModel.from_pretrained(model_name).save_pretrained(
+            path, safe_serialization=True
+        )
+        return path
+    except Exception as e:
+        print(f"Error preloading model {model_name}: {e}")
+        raise
+
+
+def build_tokenizer(config: Config) -> "PreTrainedTokenizerBase":
     """Build and return a tokenizer from the configuration."""
+    from transformers import AutoTokenizer
+
     try:
         tokenizer = AutoTokenizer.from_pretrained(config.model_name)
         return tokenizer
@@ -18,8 +55,11 @@ def build_tokenizer(config: Config) -> PreTrainedTokenizerBase:
         raise
 
 
-def build_model(config: Config) -> PreTrainedModel:
+def build_model(config: Config) -> "PreTrainedModel":
     """Build and return a model from the configuration."""
+    import torch
+    from transformers import AutoModelForMaskedLM
+
     try:
         model = AutoModelForMaskedLM.from_pretrained(config.model_name)
         if torch.cuda.is_available():
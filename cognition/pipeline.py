@@ -0,0 +1,233 @@
+"""Streaming fetch -> format -> embed -> index pipeline."""
+
+import queue
+import threading
+import time
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+from tqdm import tqdm
+
+from cognition.config import Config
+from cognition.formatter import MAX_CHARS_PER_TOKEN, Formatter
+from cognition.search import MAX_LENGTH, EmbeddingEncoder
+from cognition.store import EmbeddingStore
+
+if TYPE_CHECKING:
+    from fetcher.services import ForumService
+
+# Marks the end of the stream on every queue
+_DONE = object()
+
+
+class _Aborted(Exception):
+    """Raised inside a stage when another stage has failed."""
+
+
+class StreamingPipeline:
+    """Runs fetching, formatting, encoding and indexing concurrently.
+
+    Stages are connected by bounded queues, so a slow encoder makes the
+    fetcher wait instead of buffering the whole stream in memory. The
+    encoder works on micro-batches of up to ``batch_size`` texts, or
+    whatever arrived within ``max_wait`` seconds. Each batch is appended to
+    the store and published right away, so it is searchable seconds after
+    it was fetched. Records are stored next to their vectors, so results
+    can be displayed without a snapshot file. The store doubles as the
+    checkpoint: records already indexed are skipped before their comments
+    are fetched, so a crashed or interrupted run resumes where it stopped.
+    """
+
+    SOURCES = ("entries", "articles")
+
+    def __init__(
+        self,
+        service: "ForumService",
+        formatter: Formatter,
+        encoder: EmbeddingEncoder,
+        config: Config,
+        index_path: str,
+        source: str = "entries",
+        limit: int | None = None,
+        interval: float = 0,
+        batch_size: int = 32,
+        max_wait: float = 2.0,
+        queue_size: int = 256,
+    ):
+        if source not in self.SOURCES:
+            raise ValueError(
+                f"Unknown source '{source}', expected one of {self.SOURCES}"
+            )
+
+        self.service = service
+        self.formatter = formatter
+        self.encoder = encoder
+        self.config = config
+        self.index_path = index_path
+        self.source = source
+        self.limit = limit
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.queue_size = queue_size
+
+        self.store = (
+            EmbeddingStore(index_path) if EmbeddingStore.exists(index_path) else None
+        )
+        self.fetched = 0
+        self.indexed = 0
+        self._stop = threading.Event()
+        self._abort = threading.Event()
+        self._errors: list[BaseException] = []
+
+    def stop(self):
+        """Stop fetching; records already fetched are still indexed."""
+        self._stop.set()
+
+    def _put(self, q: queue.Queue, item):
+        # Block while the next stage is busy, but give up if a stage failed
+        while True:
+            if self._abort.is_set():
+                raise _Aborted()
+            try:
+                q.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                pass
+
+    def _get(self, q: queue.Queue, timeout: float | None = None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._abort.is_set():
+                raise _Aborted()
+            wait = 0.5 if deadline is None else min(0.5, deadline - time.monotonic())
+            try:
+                return q.get(timeout=max(wait, 0))
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+
+    def _fetch(self, out: queue.Queue):
+        indexed_ids = set(self.store.keys) if self.store else set()
+        while not self._stop.is_set():
+            if self.source == "entries":
+                records = self.service.iter_entries_with_comments(
+                    self.limit, exclude_ids=indexed_ids
+                )
+            else:
+                records = self.service.iter_articles_with_comments(
+                    self.limit, exclude_ids=indexed_ids
+                )
+
+            with closing(records):
+                for record in records:
+                    indexed_ids.add(record.id)
+                    self._put(out, record)
+                    self.fetched += 1
+                    if self._stop.is_set():
+                        break
+
+            # Poll again after the interval, or finish after a single pass.
+            # A failed stage sets _stop too, which ends the wait early
+            if not self.interval or self._stop.wait(self.interval):
+                break
+        self._put(out, _DONE)
+
+    def _format(self, inp: queue.Queue, out: queue.Queue):
+        max_chars = MAX_LENGTH * MAX_CHARS_PER_TOKEN
+        while (record := self._get(inp)) is not _DONE:
+            data = record.model_dump()
+            text = self.formatter.format_record(data, max_chars=max_chars)
+            self._put(out, (record.id, data, text))
+        self._put(out, _DONE)
+
+    def _encode(self, inp: queue.Queue, out: queue.Queue):
+        done = False
+        while not done:
+            # Wait for the first text, then collect more until the batch is
+            # full or max_wait has passed, so a trickle still gets indexed
+            item = self._get(inp)
+            if item is _DONE:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._get(inp, timeout=deadline - time.monotonic())
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+
+            keys, records, texts = map(list, zip(*batch))
+            embeddings = self.encoder.encode(
+                texts, batch_size=self.batch_size, show_progress=False
+            )
+            self._put(out, (keys, records, embeddings))
+        self._put(out, _DONE)
+
+    def _index(self, inp: queue.Queue):
+        progress_bar = tqdm(desc="Indexing records", unit="record")
+        while (item := self._get(inp)) is not _DONE:
+            keys, records, embeddings = item
+            if self.store is None:
+                self.store = EmbeddingStore.create(
+                    self.index_path,
+                    dim=embeddings.shape[1],
+                    dtype=self.config.embedding_dtype,
+                    keep_fp32=self.config.rescore_candidates > 0,
+                )
+            self.store.append(embeddings, keys=keys, records=records)
+            self.indexed += len(keys)
+            progress_bar.update(len(keys))
+            progress_bar.set_postfix(
+                {"fetched": self.fetched, "total": len(self.store)}
+            )
+        progress_bar.close()
+
+    def _run_stage(self, stage, *queues):
+        try:
+            stage(*queues)
+        except _Aborted:
+            pass
+        except BaseException as e:
+            self._errors.append(e)
+            self._abort.set()
+            self._stop.set()
+
+    def run(self) -> dict[str, int]:
+        """Run all stages until the stream ends, is stopped or fails."""
+        records = queue.Queue(maxsize=self.queue_size)
+        texts = queue.Queue(maxsize=self.queue_size)
+        embeddings = queue.Queue(maxsize=max(self.queue_size // self.batch_size, 1))
+        stages = [
+            (self._fetch, records),
+            (self._format, records, texts),
+            (self._encode, texts, embeddings),
+            (self._index, embeddings),
+        ]
+        threads = [
+            threading.Thread(
+                target=self._run_stage, args=stage, name=stage[0].__name__, daemon=True
+            )
+            for stage in stages
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            for thread in threads:
+                # Join with a timeout so Ctrl+C reaches the main thread
+                while thread.is_alive():
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            print("\nStopping: indexing records that were already fetched...")
+            self.stop()
+            for thread in threads:
+                thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+        return {"fetched": self.fetched, "indexed": self.indexed}
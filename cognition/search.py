@@ -1,28 +1,53 @@
 """Semantic search functionality."""
 
-import torch
-import torch.nn.functional as F
+import os
+import time
+from typing import Callable
+
+import numpy as np
 from tqdm import tqdm
-from transformers import AutoModel, AutoTokenizer
 
 from cognition.config import Config
+from cognition.models import resolve_model_path
+from cognition.store import EmbeddingStore, to_numpy
 from cognition.utils import local_device
 
+# Token budget of BERT-style encoders; longer inputs are truncated
+MAX_LENGTH = 512
+
 
 class EmbeddingEncoder:
-    def __init__(self, config: Config, device=None):
+    def __init__(self, config: Config, device=None, model_name: str | None = None):
+        # torch and transformers take seconds to import, so they are only
+        # loaded once an encoder is actually needed
+        from transformers import AutoModel, AutoTokenizer
+
         if device is None:
             self.device = local_device()
         else:
             self.device = device
 
-        self.tokenizer = AutoTokenizer.from_pretrained(config.model_name)
-        self.model = AutoModel.from_pretrained(config.model_name).to(self.device)
+        # Preloaded artifacts are safetensors, which are memory-mapped on load
+        # instead of being unpickled; low_cpu_mem_usage skips random init
+        # (it requires accelerate, installed with the ml extras)
+        model_path = resolve_model_path(config, model_name)
+        is_local = os.path.isdir(model_path)
+        self.tokenizer = AutoTokenizer.from_pretrained(
+            model_path, local_files_only=is_local
+        )
+        self.model = AutoModel.from_pretrained(
+            model_path,
+            local_files_only=is_local,
+            use_safetensors=True if is_local else None,
+            low_cpu_mem_usage=True,
+        ).to(self.device)
 
         self.model.eval()
 
-    def encode(self, inputs, normalize=True, batch_size=32):
+    def encode(self, inputs, normalize=True, batch_size=32, show_progress=True):
         """Encode the inputs into embeddings with optional progress tracking."""
+        import torch
+        import torch.nn.functional as F
 
         if isinstance(inputs, str):
             inputs = [inputs]
@@ -38,7 +63,9 @@ class EmbeddingEncoder:
 
         # Create progress bar to track batch processing
         # Shows which batch we're on and estimated completion time
-        progress_bar = tqdm(batches, desc="Encoding batches", unit="batch")
+        progress_bar = tqdm(
+            batches, desc="Encoding batches", unit="batch", disable=not show_progress
+        )
 
         for batch in progress_bar:
             # STEP 1: TOKENIZATION
@@ -51,7 +78,7 @@ class EmbeddingEncoder:
                 batch,
                 padding=True,
                 truncation=True,
-                max_length=512,
+                max_length=MAX_LENGTH,
                 return_tensors="pt",
             ).to(self.device)  # Move tensors to GPU/MPS for processing
 
@@ -123,3 +150,102 @@ class EmbeddingEncoder:
         # Final shape: [total_inputs, hidden_size]
         # Now we have one embedding vector per input text
         return torch.cat(all_embeddings, dim=0)
+
+
+class RetrievalCascade:
+    """Two-stage retrieval over a corpus indexed with a small, fast encoder.
+
+    Stage one embeds the query with ``fast_encoder`` and takes the top
+    ``candidates`` rows from ``store``. Stage two embeds the query and only
+    those candidate documents with ``rerank_encoder`` (the base model) and
+    re-ranks them. Any object with a compatible ``encode`` method can act as
+    the reranker. Reranker document embeddings are cached in memory, so
+    documents that recur across queries are encoded once.
+
+    ``document`` returns the text of a row, and is only called when the row
+    first becomes a candidate. Rows it has no text for (``None``) are left
+    out of the ranking and collected in ``missing``.
+    """
+
+    def __init__(
+        self,
+        fast_encoder: EmbeddingEncoder,
+        rerank_encoder: EmbeddingEncoder,
+        store: EmbeddingStore,
+        document: Callable[[int], str | None],
+        candidates: int = 200,
+        rescore: int = 0,
+    ):
+        self.fast_encoder = fast_encoder
+        self.rerank_encoder = rerank_encoder
+        self.store = store
+        self.document = document
+        self.candidates = candidates
+        self.rescore = rescore
+        self.missing: set[int] = set()
+        self._rerank_cache: dict[int, np.ndarray] = {}
+
+    def search(
+        self, query: str, top_k: int = 10
+    ) -> tuple[list[tuple[int, float]], dict[str, float]]:
+        """Return ranked ``(row, score)`` pairs and per-stage latencies."""
+        start = time.perf_counter()
+        candidates = self.store.search(
+            self.fast_encoder.encode(query),
+            top_k=self.candidates,
+            rescore=self.rescore,
+        )
+        candidates_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rows = [row for row, _ in candidates]
+        new_rows = [
+            row
+            for row in rows
+            if row not in self._rerank_cache and row not in self.missing
+        ]
+        texts = [self.document(row) for row in new_rows]
+        self.missing.update(row for row, text in zip(new_rows, texts) if text is None)
+        found = [(row, text) for row, text in zip(new_rows, texts) if text is not None]
+        if found:
+            embeddings = to_numpy(
+                self.rerank_encoder.encode([text for _, text in found])
+            )
+            self._rerank_cache.update(zip([row for row, _ in found], embeddings))
+
+        rows = [row for row in rows if row in self._rerank_cache]
+        query_embedding = to_numpy(self.rerank_encoder.encode(query))[0]
+        vectors = [self._rerank_cache[row] for row in rows]
+        scores = np.stack(vectors) @ query_embedding if rows else np.empty(0)
+        order = np.argsort(-scores)[:top_k]
+        rerank_seconds = time.perf_counter() - start
+
+        results = [(rows[i], float(scores[i])) for i in order]
+        return results, {"candidates": candidates_seconds, "rerank": rerank_seconds}
+
+    def evaluate(
+        self, queries: list[str], baseline_store: EmbeddingStore, top_k: int = 10
+    ) -> dict[str, float]:
+        """Compare against single-stage search over a base-model index.
+
+        Reports mean recall@k of the cascade versus the baseline top-k, and
+        mean latencies of the baseline and of both cascade stages.
+        """
+        totals = {"recall": 0.0, "baseline": 0.0, "candidates": 0.0, "rerank": 0.0}
+        for query in queries:
+            start = time.perf_counter()
+            baseline = baseline_store.search(
+                self.rerank_encoder.encode(query), top_k=top_k, rescore=self.rescore
+            )
+            totals["baseline"] += time.perf_counter() - start
+
+            results, timings = self.search(query, top_k=top_k)
+            totals["candidates"] += timings["candidates"]
+            totals["rerank"] += timings["rerank"]
+
+            # Rows of the two stores differ, so results are matched by key
+            expected = {baseline_store.keys[row] for row, _ in baseline}
+            found = {self.store.keys[row] for row, _ in results}
+            totals["recall"] += len(expected & found) / max(len(expected), 1)
+
+        return {name: value / len(queries) for name, value in totals.items()}
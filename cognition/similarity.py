@@ -0,0 +1,279 @@
+"""All-pairs similarity join over stored embeddings."""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from cognition.store import EmbeddingStore
+
+
+def _merge_top_k(ids, scores, new_ids, new_scores, k: int):
+    """Merge two row-aligned candidate lists, keeping the best ``k`` per row."""
+    all_ids = np.concatenate([ids, new_ids], axis=1)
+    all_scores = np.concatenate([scores, new_scores], axis=1)
+    if all_scores.shape[1] <= k:
+        return all_ids, all_scores
+
+    best = np.argpartition(-all_scores, k - 1, axis=1)[:, :k]
+    return (
+        np.take_along_axis(all_ids, best, axis=1),
+        np.take_along_axis(all_scores, best, axis=1),
+    )
+
+
+def _row_top_k(scores: np.ndarray, offset: int, k: int):
+    """Best ``k`` columns of every row of a score tile, as global ids."""
+    k = min(k, scores.shape[1])
+    best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    return best + offset, np.take_along_axis(scores, best, axis=1)
+
+
+class Neighbours:
+    """Top-k neighbour lists for the first ``len(self)`` rows of a store."""
+
+    def __init__(self, k: int, generation: str = ""):
+        self.k = k
+        self.generation = generation
+        self.ids = np.full((0, k), -1, dtype=np.int64)
+        self.scores = np.full((0, k), -np.inf, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def load(cls, file_path: str, k: int, store: EmbeddingStore) -> "Neighbours":
+        """Load saved neighbours, starting fresh if they no longer match ``store``."""
+        neighbours = cls(k, store.generation)
+        if os.path.exists(file_path):
+            data = np.load(file_path)
+            if data["ids"].shape[1] == k and store.matches(
+                str(data["generation"]), len(data["ids"])
+            ):
+                neighbours.ids = data["ids"]
+                neighbours.scores = data["scores"]
+        return neighbours
+
+    def save(self, file_path: str):
+        with open(file_path, "wb") as f:
+            np.savez(
+                f,
+                generation=np.array(self.generation),
+                ids=self.ids,
+                scores=self.scores,
+            )
+
+    def extend(self, count: int):
+        """Add empty neighbour lists for rows up to ``count``."""
+        missing = count - len(self)
+        if missing > 0:
+            self.ids = np.concatenate(
+                [self.ids, np.full((missing, self.k), -1, dtype=np.int64)]
+            )
+            self.scores = np.concatenate(
+                [self.scores, np.full((missing, self.k), -np.inf, dtype=np.float32)]
+            )
+
+    def to_table(self, keys: list[str], min_score: float | None = None) -> dict:
+        """Build a ``key -> [{id, score}, ...]`` table sorted by score."""
+        table = {}
+        for row in range(len(self)):
+            order = np.argsort(-self.scores[row])
+            table[keys[row]] = [
+                {
+                    "id": keys[self.ids[row, i]],
+                    "score": round(float(self.scores[row, i]), 4),
+                }
+                for i in order
+                if np.isfinite(self.scores[row, i])
+                and (min_score is None or self.scores[row, i] >= min_score)
+            ]
+        return table
+
+
+class Pairs:
+    """All pairs scoring at least ``threshold`` among the first ``count`` rows."""
+
+    def __init__(self, threshold: float, generation: str = ""):
+        self.threshold = threshold
+        self.generation = generation
+        self.count = 0
+        self.rows = np.empty(0, dtype=np.int64)
+        self.cols = np.empty(0, dtype=np.int64)
+        self.scores = np.empty(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    @classmethod
+    def load(cls, file_path: str, threshold: float, store: EmbeddingStore) -> "Pairs":
+        """Load saved pairs, starting fresh if they no longer match ``store``."""
+        pairs = cls(threshold, store.generation)
+        if os.path.exists(file_path):
+            data = np.load(file_path)
+            if float(data["threshold"]) == threshold and store.matches(
+                str(data["generation"]), int(data["count"])
+            ):
+                pairs.count = int(data["count"])
+                pairs.rows = data["rows"]
+                pairs.cols = data["cols"]
+                pairs.scores = data["scores"]
+        return pairs
+
+    def save(self, file_path: str):
+        with open(file_path, "wb") as f:
+            np.savez(
+                f,
+                generation=np.array(self.generation),
+                threshold=np.array(self.threshold),
+                count=np.array(self.count),
+                rows=self.rows,
+                cols=self.cols,
+                scores=self.scores,
+            )
+
+    def to_table(self, keys: list[str]) -> dict:
+        """Build a ``key -> [{id, score}, ...]`` table with both directions."""
+        table = {key: [] for key in keys[: self.count]}
+        for i, j, score in zip(
+            self.rows.tolist(), self.cols.tolist(), self.scores.tolist()
+        ):
+            table[keys[i]].append({"id": keys[j], "score": round(score, 4)})
+            table[keys[j]].append({"id": keys[i], "score": round(score, 4)})
+        for related in table.values():
+            related.sort(key=lambda x: x["score"], reverse=True)
+        return table
+
+
+class SimilarityJoin:
+    """Blocked similarity join over the vectors of an ``EmbeddingStore``.
+
+    Scores are computed tile by tile with matrix multiplies, so memory stays
+    bounded by ``block_size`` squared per worker instead of N x N. Tiles are
+    processed on a thread pool; numpy releases the GIL inside matmul.
+    """
+
+    def __init__(
+        self, store: EmbeddingStore, block_size: int = 2048, workers: int | None = None
+    ):
+        self.store = store
+        self.block_size = block_size
+        self.workers = workers or os.cpu_count() or 1
+
+    def _blocks(self, start: int, stop: int):
+        return [
+            (i, min(i + self.block_size, stop))
+            for i in range(start, stop, self.block_size)
+        ]
+
+    def _check_state(self, generation: str, count: int):
+        if count and not self.store.matches(generation, count):
+            raise ValueError("Saved join state was built from a different store")
+
+    def top_k(self, k: int = 10, neighbours: Neighbours | None = None) -> Neighbours:
+        """Compute top-k neighbours for every row, reusing ``neighbours``.
+
+        Only rows added since ``neighbours`` was built are scored as queries.
+        Existing rows are updated against the new rows only, so the cost is
+        proportional to ``new x total`` rather than ``total x total``. Rows
+        are read from the store one tile at a time, so memory does not grow
+        with the corpus or the size of the increment.
+        """
+        neighbours = neighbours if neighbours is not None else Neighbours(k)
+        self._check_state(neighbours.generation, len(neighbours))
+        neighbours.generation = self.store.generation
+        start, stop = len(neighbours), len(self.store)
+        if start >= stop:
+            return neighbours
+        neighbours.extend(stop)
+
+        def score_new(block):
+            # New rows against every row; filled in-place per query block
+            qs, qe = block
+            queries = self.store.vectors(qs, qe)
+            ids = neighbours.ids[qs:qe]
+            scores = neighbours.scores[qs:qe]
+            for cs, ce in self._blocks(0, stop):
+                tile = queries @ self.store.vectors(cs, ce).T
+                if cs < qe and qs < ce:
+                    rows = np.arange(qs, qe)
+                    cols = rows - cs
+                    inside = (cols >= 0) & (cols < ce - cs)
+                    tile[(rows - qs)[inside], cols[inside]] = -np.inf
+                ids, scores = _merge_top_k(ids, scores, *_row_top_k(tile, cs, k), k)
+            neighbours.ids[qs:qe] = ids
+            neighbours.scores[qs:qe] = scores
+
+        def score_old(block):
+            # Existing rows only need to consider the new rows as candidates
+            qs, qe = block
+            queries = self.store.vectors(qs, qe)
+            ids = neighbours.ids[qs:qe]
+            scores = neighbours.scores[qs:qe]
+            for cs, ce in self._blocks(start, stop):
+                tile = queries @ self.store.vectors(cs, ce).T
+                ids, scores = _merge_top_k(ids, scores, *_row_top_k(tile, cs, k), k)
+            neighbours.ids[qs:qe] = ids
+            neighbours.scores[qs:qe] = scores
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(score_new, self._blocks(start, stop)))
+            list(executor.map(score_old, self._blocks(0, start)))
+
+        return neighbours
+
+    def threshold_pairs(self, threshold: float, pairs: Pairs | None = None) -> Pairs:
+        """Collect all pairs above ``threshold``, reusing ``pairs``.
+
+        Only pairs involving rows added since ``pairs`` was built are scored.
+        """
+        pairs = pairs if pairs is not None else Pairs(threshold)
+        self._check_state(pairs.generation, pairs.count)
+        pairs.generation = self.store.generation
+
+        found = list(self.pairs(threshold, start=pairs.count))
+        if found:
+            rows, cols, scores = zip(*found)
+            pairs.rows = np.concatenate([pairs.rows, np.array(rows, dtype=np.int64)])
+            pairs.cols = np.concatenate([pairs.cols, np.array(cols, dtype=np.int64)])
+            pairs.scores = np.concatenate(
+                [pairs.scores, np.array(scores, dtype=np.float32)]
+            )
+        pairs.count = len(self.store)
+        return pairs
+
+    def pairs(self, threshold: float, start: int = 0):
+        """Yield ``(i, j, score)`` for all pairs with ``j < i`` above ``threshold``.
+
+        Pass ``start`` to only emit pairs that involve rows from ``start`` on.
+        """
+
+        def score_block(block):
+            qs, qe = block
+            queries = self.store.vectors(qs, qe)
+            found = []
+            for cs, ce in self._blocks(0, qe):
+                tile = queries @ self.store.vectors(cs, ce).T
+                rows, cols = np.nonzero(tile >= threshold)
+                keep = cols + cs < rows + qs
+                found.extend(
+                    zip(
+                        (rows[keep] + qs).tolist(),
+                        (cols[keep] + cs).tolist(),
+                        tile[rows[keep], cols[keep]].tolist(),
+                    )
+                )
+            return found
+
+        blocks = self._blocks(start, len(self.store))
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for found in executor.map(score_block, blocks):
+                yield from found
+
+
+def save_related_table(file_path: str, table: dict):
+    """Write the related-posts table as JSON."""
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(table, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,380 @@
+"""Compact on-disk embedding storage with reduced-precision vectors."""
+
+import json
+import os
+import re
+import shutil
+import uuid
+
+import numpy as np
+
+SUPPORTED_DTYPES = ("float16", "int8")
+
+
+def to_numpy(embeddings) -> np.ndarray:
+    """Convert a torch tensor or array-like into a 2D float32 numpy array."""
+    if hasattr(embeddings, "detach"):
+        embeddings = embeddings.detach().cpu().float().numpy()
+    array = np.asarray(embeddings, dtype=np.float32)
+    if array.ndim == 1:
+        array = array[np.newaxis, :]
+    return array
+
+
+def quantize_int8(embeddings: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Scalar-quantize each vector to int8 with its own scale factor."""
+    scales = np.abs(embeddings).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.rint(embeddings / scales[:, np.newaxis])
+    return np.clip(codes, -127, 127).astype(np.int8), scales.astype(np.float32)
+
+
+class EmbeddingStore:
+    """Append-only embedding store backed by memory-mapped files.
+
+    Vectors are kept as float16 or int8 (with a float32 scale per vector) in
+    ``vectors.bin``. An optional full-precision copy in ``fp32.bin`` is only
+    touched when rescoring the top candidates of a search. Readers map the
+    files read-only, so many processes can share the same pages.
+
+    The records themselves can be kept in ``records.jsonl``, one line per
+    row, with the end offset of each line in ``record_offsets.bin`` so any
+    row is read with a single seek.
+
+    Every ``create()`` assigns a new ``generation`` and builds its files in
+    a directory of that name, published by atomically replacing
+    ``meta.json``. Readers that still map the previous generation keep
+    working until they ``refresh()``. State derived from the store
+    (neighbour lists, topic centroids) records the generation, so it can be
+    discarded when the store it was built from has been replaced.
+    """
+
+    META_FILE = "meta.json"
+    VECTORS_FILE = "vectors.bin"
+    SCALES_FILE = "scales.bin"
+    FP32_FILE = "fp32.bin"
+    KEYS_FILE = "keys.txt"
+    RECORDS_FILE = "records.jsonl"
+    OFFSETS_FILE = "record_offsets.bin"
+    DATA_FILES = (
+        VECTORS_FILE,
+        SCALES_FILE,
+        FP32_FILE,
+        KEYS_FILE,
+        RECORDS_FILE,
+        OFFSETS_FILE,
+    )
+
+    def __init__(self, path: str):
+        self.path = path
+        self._vectors = None
+        self._scales = None
+        self._fp32 = None
+        self._mapped: tuple[str, int] | None = None
+        self.refresh()
+
+    @classmethod
+    def create(
+        cls, path: str, dim: int, dtype: str = "int8", keep_fp32: bool = True
+    ) -> "EmbeddingStore":
+        """Create an empty store at ``path``, replacing any existing one."""
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(
+                f"Unsupported embedding dtype '{dtype}', "
+                f"expected one of {SUPPORTED_DTYPES}"
+            )
+
+        os.makedirs(path, exist_ok=True)
+        previous = cls._read_meta(path).get("data_dir") if cls.exists(path) else None
+
+        # Existing files are never truncated: processes may still map them
+        generation = uuid.uuid4().hex
+        os.makedirs(os.path.join(path, generation))
+        for name in cls.DATA_FILES:
+            open(os.path.join(path, generation, name), "wb").close()
+
+        meta = {
+            "dim": dim,
+            "dtype": dtype,
+            "count": 0,
+            "has_fp32": keep_fp32,
+            "has_records": True,
+            "generation": generation,
+            "data_dir": generation,
+        }
+        cls._write_meta(path, meta)
+
+        # The previous generation is kept for readers that opened it before
+        # the switch; older ones are removed
+        for entry in os.listdir(path):
+            entry_path = os.path.join(path, entry)
+            if (
+                entry not in (generation, previous)
+                and re.fullmatch(r"[0-9a-f]{32}", entry)
+                and os.path.isdir(entry_path)
+            ):
+                shutil.rmtree(entry_path, ignore_errors=True)
+        return cls(path)
+
+    @classmethod
+    def exists(cls, path: str) -> bool:
+        """Check whether a store has been created at ``path``."""
+        return os.path.exists(os.path.join(path, cls.META_FILE))
+
+    @staticmethod
+    def _read_meta(path: str) -> dict:
+        with open(
+            os.path.join(path, EmbeddingStore.META_FILE), "r", encoding="utf-8"
+        ) as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_meta(path: str, meta: dict):
+        # Write to a temp file and rename so readers never see a partial update
+        tmp_path = os.path.join(path, EmbeddingStore.META_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, os.path.join(path, EmbeddingStore.META_FILE))
+
+    def _file(self, name: str) -> str:
+        # Stores created before generation directories keep their files flat
+        return os.path.join(self.path, self.meta.get("data_dir", ""), name)
+
+    def refresh(self):
+        """Reload metadata to pick up vectors appended by another process.
+
+        After the store was recreated, this switches to the new generation.
+        """
+        self.meta = self._read_meta(self.path)
+
+        with open(self._file(self.KEYS_FILE), "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self._keys = lines[: self.meta["count"]]
+        self._keys_on_disk = len(lines)
+
+    def __len__(self) -> int:
+        return self.meta["count"]
+
+    @property
+    def dim(self) -> int:
+        return self.meta["dim"]
+
+    @property
+    def dtype(self) -> str:
+        return self.meta["dtype"]
+
+    @property
+    def generation(self) -> str:
+        """Identifier of this store's contents, renewed by ``create()``."""
+        return self.meta.get("generation", "")
+
+    def matches(self, generation: str, count: int) -> bool:
+        """Check whether state derived from ``count`` rows is still valid."""
+        return generation == self.generation and count <= len(self)
+
+    @property
+    def keys(self) -> list[str]:
+        """Record keys in insertion order (empty strings when not provided)."""
+        return self._keys
+
+    def append(
+        self,
+        embeddings,
+        keys: list[str] | None = None,
+        records: list[dict] | None = None,
+    ):
+        """Quantize and append embeddings, then publish the new count.
+
+        ``records`` are stored alongside the vectors and returned by
+        ``record()``; rows appended without one have no record.
+        """
+        embeddings = to_numpy(embeddings)
+        if embeddings.shape[1] != self.dim:
+            raise ValueError(
+                f"Embedding dimension {embeddings.shape[1]} does not match "
+                f"store dimension {self.dim}"
+            )
+        if keys is None:
+            keys = [""] * len(embeddings)
+        if len(keys) != len(embeddings):
+            raise ValueError("Number of keys must match number of embeddings")
+        if self._read_meta(self.path).get("generation") != self.generation:
+            raise ValueError(
+                f"Store at {self.path} was recreated by another process; "
+                "reopen it before appending"
+            )
+        if records is not None and len(records) != len(embeddings):
+            raise ValueError("Number of records must match number of embeddings")
+
+        count = len(self)
+        if self.dtype == "int8":
+            codes, scales = quantize_int8(embeddings)
+            self._write_rows(self.VECTORS_FILE, codes, count)
+            self._write_rows(self.SCALES_FILE, scales, count)
+        else:
+            self._write_rows(self.VECTORS_FILE, embeddings.astype(np.float16), count)
+        if self.meta["has_fp32"]:
+            self._write_rows(self.FP32_FILE, embeddings, count)
+
+        # Rewrite keys if a previous append was interrupted before publishing
+        new_keys = [str(key) for key in keys]
+        if self._keys_on_disk == count:
+            with open(self._file(self.KEYS_FILE), "a", encoding="utf-8") as f:
+                f.write("".join(f"{key}\n" for key in new_keys))
+        else:
+            with open(self._file(self.KEYS_FILE), "w", encoding="utf-8") as f:
+                f.write("".join(f"{key}\n" for key in self._keys + new_keys))
+        self._keys = self._keys + new_keys
+        self._keys_on_disk = len(self._keys)
+
+        if self.meta.get("has_records"):
+            self._write_records(records or [None] * len(embeddings), count)
+
+        self.meta["count"] = count + len(embeddings)
+        self._write_meta(self.path, self.meta)
+
+    def _write_rows(self, name: str, rows: np.ndarray, count: int):
+        """Write rows at position ``count``, dropping any unpublished tail."""
+        row_bytes = rows.itemsize * (rows.shape[1] if rows.ndim > 1 else 1)
+        with open(self._file(name), "r+b") as f:
+            f.truncate(count * row_bytes)
+            f.seek(count * row_bytes)
+            f.write(np.ascontiguousarray(rows).tobytes())
+
+    def _write_records(self, records: list[dict | None], count: int):
+        """Append records as JSON lines at row ``count``."""
+        lines = [
+            (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+            for record in records
+        ]
+        start = self._record_end(count - 1) if count else 0
+        offsets = start + np.cumsum([len(line) for line in lines], dtype=np.int64)
+        with open(self._file(self.RECORDS_FILE), "r+b") as f:
+            f.truncate(start)
+            f.seek(start)
+            f.write(b"".join(lines))
+        self._write_rows(self.OFFSETS_FILE, offsets, count)
+
+    def _record_end(self, row: int) -> int:
+        offset = np.fromfile(
+            self._file(self.OFFSETS_FILE), dtype=np.int64, count=1, offset=row * 8
+        )
+        return int(offset[0])
+
+    def record(self, row: int) -> dict | None:
+        """Return the record stored for ``row``, or None if there is none."""
+        if not self.meta.get("has_records") or not 0 <= row < len(self):
+            return None
+
+        start = self._record_end(row - 1) if row else 0
+        with open(self._file(self.RECORDS_FILE), "rb") as f:
+            f.seek(start)
+            line = f.read(self._record_end(row) - start)
+        return json.loads(line)
+
+    def _map(self):
+        """(Re)map the data files read-only for the published vector count."""
+        count = len(self)
+        if self._mapped == (self.generation, count):
+            return
+
+        dtype = np.int8 if self.dtype == "int8" else np.float16
+        shape = (count, self.dim)
+        self._vectors = np.memmap(
+            self._file(self.VECTORS_FILE), dtype=dtype, mode="r", shape=shape
+        )
+        if self.dtype == "int8":
+            self._scales = np.memmap(
+                self._file(self.SCALES_FILE), dtype=np.float32, mode="r", shape=(count,)
+            )
+        if self.meta["has_fp32"]:
+            self._fp32 = np.memmap(
+                self._file(self.FP32_FILE), dtype=np.float32, mode="r", shape=shape
+            )
+        self._mapped = (self.generation, count)
+
+    def vectors(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Return rows ``start:stop`` dequantized to float32."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        if stop <= start:
+            return np.empty((0, self.dim), dtype=np.float32)
+
+        self._map()
+        block = self._vectors[start:stop].astype(np.float32)
+        if self.dtype == "int8":
+            block *= self._scales[start:stop, np.newaxis]
+        return block
+
+    def search(
+        self, query, top_k: int = 10, rescore: int = 0, block_size: int = 4096
+    ) -> list[tuple[int, float]]:
+        """Find the ``top_k`` rows with the highest dot product to ``query``.
+
+        Scores are computed block by block on the quantized data, so only
+        ``block_size`` rows are ever converted to float32 at once. When
+        ``rescore`` is set and full-precision vectors are stored, the best
+        ``rescore`` candidates are re-ranked using the float32 copy.
+        """
+        if len(self) == 0:
+            return []
+
+        query = to_numpy(query)[0]
+        rescore = rescore if self.meta["has_fp32"] else 0
+        num_candidates = min(max(top_k, rescore), len(self))
+
+        self._map()
+        candidate_ids = []
+        candidate_scores = []
+        for start in range(0, len(self), block_size):
+            stop = min(start + block_size, len(self))
+            scores = self._vectors[start:stop].astype(np.float32) @ query
+            if self.dtype == "int8":
+                scores *= self._scales[start:stop]
+
+            if len(scores) > num_candidates:
+                best = np.argpartition(-scores, num_candidates - 1)[:num_candidates]
+            else:
+                best = np.arange(len(scores))
+            candidate_ids.append(best + start)
+            candidate_scores.append(scores[best])
+
+        ids = np.concatenate(candidate_ids)
+        scores = np.concatenate(candidate_scores)
+
+        if rescore:
+            best = np.argsort(-scores)[:num_candidates]
+            ids = np.sort(ids[best])  # Sorted ids keep memmap reads sequential
+            scores = self._fp32[ids] @ query
+
+        order = np.argsort(-scores)[:top_k]
+        return [(int(ids[i]), float(scores[i])) for i in order]
+
+
+class QueryCache:
+    """Query embeddings saved next to an index, keyed by model and query text.
+
+    A cache hit lets a search skip importing torch and loading the encoder.
+    """
+
+    def __init__(self, file_path: str, model_name: str):
+        self.file_path = file_path
+        self.model_name = model_name
+        self._queries: dict[str, np.ndarray] = {}
+
+        if os.path.exists(file_path):
+            data = np.load(file_path)
+            if str(data["model_name"]) == model_name:
+                self._queries = dict(zip(data["queries"].tolist(), data["vectors"]))
+
+    def get(self, query: str) -> np.ndarray | None:
+        return self._queries.get(query)
+
+    def put(self, query: str, embedding):
+        self._queries[query] = to_numpy(embedding)[0]
+        with open(self.file_path, "wb") as f:
+            np.savez(
+                f,
+                model_name=np.array(self.model_name),
+                queries=np.array(list(self._queries), dtype=str),
+                vectors=np.stack(list(self._queries.values())),
+            )
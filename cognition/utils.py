@@ -1,7 +1,6 @@
-import torch
-
-
 def local_device():
+    import torch
+
     if torch.cuda.is_available():
         return "cuda"
     elif torch.backends.mps.is_available():
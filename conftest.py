@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def normalized():
+    """Factory for random unit vectors, reproducible through ``seed``."""
+
+    def make(rows: int, dim: int, seed: int = 0) -> np.ndarray:
+        rng = np.random.default_rng(seed)
+        vectors = rng.normal(size=(rows, dim)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    return make
@@ -1,6 +1,6 @@
 """API client for forum interactions."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import httpx
 
@@ -56,6 +56,12 @@ class ForumAPIClient:
 
     def _get_list(self, endpoint: str, limit: int = 25) -> List[Dict[str, Any]]:
         """Generic method to fetch a list of items from the API."""
+        return [item for page in self._iter_pages(endpoint, limit) for item in page]
+
+    def _iter_pages(
+        self, endpoint: str, limit: int = 25
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of items from the API as soon as each one arrives."""
         if limit <= 50:
             # Single page request
             params = {}
@@ -65,10 +71,10 @@ class ForumAPIClient:
             response = make_request_with_retry(
                 self.client, "GET", endpoint, params=params
             )
-            return response.json()["data"]
+            yield response.json()["data"]
+            return
 
         # Multi-page request for limit > 50
-        all = []
         page = 1
         per_page = 50
         remaining = limit
@@ -85,7 +91,7 @@ class ForumAPIClient:
             if not page_data:  # No more data available
                 break
 
-            all.extend(page_data)
+            yield page_data
             remaining -= len(page_data)
             page += 1
 
@@ -93,12 +99,15 @@ class ForumAPIClient:
             if len(page_data) < current_limit:
                 break
 
-        return all
-
     def get_links(self, limit: int = 25) -> List[Dict[str, Any]]:
         """Fetch links from the /links endpoint with paging support."""
         return self._get_list("/links", limit)
 
+    def iter_links(self, limit: int = 25) -> Iterator[Dict[str, Any]]:
+        """Yield links from the /links endpoint page by page."""
+        for page in self._iter_pages("/links", limit):
+            yield from page
+
     def get_link_comments(self, link_id: str) -> List[Dict[str, Any]]:
         """Fetch comments for a specific link."""
         response = make_request_with_retry(
@@ -110,6 +119,11 @@ class ForumAPIClient:
         """Fetch microblog entries from the /entries endpoint with paging support."""
         return self._get_list("/entries", limit)
 
+    def iter_entries(self, limit: int = 25) -> Iterator[Dict[str, Any]]:
+        """Yield microblog entries from the /entries endpoint page by page."""
+        for page in self._iter_pages("/entries", limit):
+            yield from page
+
     def get_entry_comments(self, entry_id: str) -> List[Dict[str, Any]]:
         """Fetch comments for a specific microblog entry."""
         response = make_request_with_retry(
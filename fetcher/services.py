@@ -3,7 +3,7 @@
 import json
 import os
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Set
 
 from .api_client import ForumAPIClient
 from .config import Config
@@ -20,13 +20,26 @@ class ForumService:
         self, max_links: int | None = None
     ) -> List[Record]:
         """Fetch articles and their associated comments."""
+        records = list(self.iter_articles_with_comments(max_links))
+        print(f"Fetched {len(records)} articles.")
+        return records
+
+    def iter_articles_with_comments(
+        self, max_links: int | None = None, exclude_ids: Set[str] | None = None
+    ) -> Iterator[Record]:
+        """Yield articles with their comments as soon as each one is fetched.
+
+        Articles whose id is in ``exclude_ids`` are skipped before their
+        comments are requested.
+        """
         max_links = max_links or self.config.max_records
-        records = []
+        exclude_ids = exclude_ids or set()
 
         with ForumAPIClient(self.config) as client:
-            links = client.get_links(limit=max_links)
+            for link in client.iter_links(limit=max_links):
+                if str(link["id"]) in exclude_ids:
+                    continue
 
-            for link in links:
                 record = Record(
                     id=str(link["id"]),
                     title=link["title"],
@@ -43,22 +56,32 @@ class ForumService:
                         [c.get("content", "") for c in comments if c.get("content", "")]
                     )
 
-                records.append(record)
-
-        print(f"Fetched {len(records)} articles.")
-        return records
+                yield record
 
     def fetch_entries_with_comments(
         self, max_entries: int | None = None
     ) -> List[Record]:
         """Fetch microblog entries and their associated comments."""
+        records = list(self.iter_entries_with_comments(max_entries))
+        print(f"Fetched {len(records)} microblog entries.")
+        return records
+
+    def iter_entries_with_comments(
+        self, max_entries: int | None = None, exclude_ids: Set[str] | None = None
+    ) -> Iterator[Record]:
+        """Yield microblog entries with their comments as soon as each one is fetched.
+
+        Entries whose id is in ``exclude_ids`` are skipped before their
+        comments are requested.
+        """
         max_entries = max_entries or self.config.max_records
-        records = []
+        exclude_ids = exclude_ids or set()
 
         with ForumAPIClient(self.config) as client:
-            entries = client.get_entries(limit=max_entries)
+            for entry in client.iter_entries(limit=max_entries):
+                if str(entry["id"]) in exclude_ids:
+                    continue
 
-            for entry in entries:
                 record = Record(
                     id=str(entry["id"]),
                     title=entry["content"],
@@ -79,10 +102,7 @@ class ForumService:
                         comments = client.get_entry_comments(entry["id"])
                         values = [c.get("content", "") for c in comments if c.get("content", "")]
                         record.set_comments(values)
-                records.append(record)
-
-        print(f"Fetched {len(records)} microblog entries.")
-        return records
+                yield record
 
 
 class FileService:
@@ -0,0 +1,66 @@
+import numpy as np
+
+from cognition.clustering import TopicClusterer
+from cognition.store import EmbeddingStore
+
+
+def clustered(rows_per_cluster: int, n_clusters: int, dim: int = 16, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centres = np.eye(dim, dtype=np.float32)[:n_clusters]
+    vectors = np.repeat(centres, rows_per_cluster, axis=0)
+    vectors += rng.normal(scale=0.05, size=vectors.shape).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    order = rng.permutation(len(vectors))
+    return vectors[order], np.repeat(np.arange(n_clusters), rows_per_cluster)[order]
+
+
+def test_partial_fit_separates_clusters():
+    vectors, truth = clustered(50, 4)
+    keys = [str(i) for i in range(len(vectors))]
+    clusterer = TopicClusterer(4, num_representatives=3)
+    labels = np.concatenate(
+        [
+            clusterer.partial_fit(vectors[start : start + 40], keys[start : start + 40])
+            for start in range(0, len(vectors), 40)
+        ]
+    )
+
+    for cluster in range(4):
+        assert len(set(truth[labels == cluster])) == 1
+    assert len(clusterer) == len(vectors)
+
+    topics = clusterer.representatives()
+    for cluster, reps in topics.items():
+        assert len(reps) == 3
+        assert {truth[int(rep["id"])] for rep in reps} == set(truth[labels == cluster])
+        assert [rep["score"] for rep in reps] == sorted(
+            (rep["score"] for rep in reps), reverse=True
+        )
+
+
+def test_records_without_keys_can_be_representatives():
+    vectors, _ = clustered(10, 2)
+    clusterer = TopicClusterer(2, num_representatives=2)
+    clusterer.partial_fit(vectors, [""] * len(vectors))
+
+    assert [len(reps) for reps in clusterer.representatives().values()] == [2, 2]
+
+
+def test_representatives_empty_before_fit():
+    assert TopicClusterer(4).representatives() == {}
+
+
+def test_state_discarded_after_rebuild(tmp_path):
+    vectors, _ = clustered(20, 4)
+    store = EmbeddingStore.create(str(tmp_path / "index"), vectors.shape[1])
+    store.append(vectors, keys=[str(i) for i in range(len(vectors))])
+    file_path = str(tmp_path / "topics.npz")
+    clusterer = TopicClusterer.load(file_path, store, 4)
+    clusterer.partial_fit(store.vectors(), store.keys)
+    clusterer.save(file_path)
+    assert len(TopicClusterer.load(file_path, store, 4)) == len(vectors)
+
+    store = EmbeddingStore.create(str(tmp_path / "index"), vectors.shape[1])
+    store.append(vectors[:10], keys=[str(i) for i in range(10)])
+
+    assert len(TopicClusterer.load(file_path, store, 4)) == 0
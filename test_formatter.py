@@ -0,0 +1,58 @@
+import pytest
+
+from cognition.benchmark import _reference_format_record
+from cognition.formatter import MAX_CHARS_PER_TOKEN, Formatter
+
+RECORDS = [
+    {
+        "title": "Biznes",
+        "comments": [
+            "@user1 @user2 first comment",
+            "  - dash before text  ",
+            "multi\nline\ncomment",
+            "@only_mention",
+            "",
+            "...",
+            "ok @mid mention",
+        ],
+    },
+    {"title": "Empty"},
+    {"comments": ["no title here"]},
+]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_format_records_matches_reference(processes):
+    records = RECORDS * 5
+    expected = [_reference_format_record(record) for record in records]
+
+    assert Formatter().format_records(records, processes=processes) == expected
+
+
+def test_format_record_cuts_comment_at_budget():
+    record = {"title": "Long", "comments": ["short one", "x" * 5000, "never seen"]}
+    expected = _reference_format_record(record)
+
+    text = Formatter().format_record(record, max_chars=4096)
+
+    assert len(text) <= 4096
+    assert len(text) >= 4096 - 3
+    assert expected.startswith(text)
+
+
+def test_format_record_within_budget_is_unchanged():
+    record = RECORDS[0]
+
+    assert Formatter().format_record(record, max_chars=10_000) == (
+        _reference_format_record(record)
+    )
+
+
+def test_format_records_token_budget():
+    record = {"title": "T", "comments": ["word " * 400] * 10}
+    max_tokens = 64
+
+    [text] = Formatter().format_records([record], max_tokens=max_tokens)
+
+    assert len(text) <= max_tokens * MAX_CHARS_PER_TOKEN
+    assert _reference_format_record(record).startswith(text)
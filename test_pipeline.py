@@ -0,0 +1,165 @@
+import itertools
+import threading
+import time
+import zlib
+
+import numpy as np
+import pytest
+
+import cognition.main
+from cognition.config import Config
+from cognition.formatter import Formatter
+from cognition.pipeline import StreamingPipeline
+from cognition.store import EmbeddingStore
+from fetcher.models import Record
+
+
+class StubService:
+    """Yields ``count`` entries (endless when None), skipping excluded ids."""
+
+    def __init__(self, count: int | None, delay: float = 0):
+        self.count = count
+        self.delay = delay
+
+    def iter_entries_with_comments(self, limit=None, exclude_ids=None):
+        ids = itertools.count() if self.count is None else range(self.count)
+        for i in ids:
+            if exclude_ids and str(i) in exclude_ids:
+                continue
+            time.sleep(self.delay)
+            yield Record(
+                id=str(i),
+                title=f"Post {i}",
+                description="",
+                source="stub",
+                type="entry/microblog",
+                created_at="2025-07-31",
+                comments=[f"comment {i}"],
+            )
+
+
+class StubEncoder:
+    """Deterministic unit vectors per text; fails on batch ``fail_on``."""
+
+    def __init__(self, fail_on: int | None = None, dim: int = 8):
+        self.fail_on = fail_on
+        self.dim = dim
+        self.batches = 0
+
+    def encode(self, inputs, **kwargs):
+        inputs = [inputs] if isinstance(inputs, str) else inputs
+        self.batches += 1
+        if self.batches == self.fail_on:
+            raise RuntimeError("encoder failed")
+        vectors = np.stack(
+            [
+                np.random.default_rng(zlib.crc32(text.encode())).normal(size=self.dim)
+                for text in inputs
+            ]
+        ).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def run_pipeline(index_path, service, encoder, **kwargs) -> StreamingPipeline:
+    pipeline = StreamingPipeline(
+        service,
+        Formatter(),
+        encoder,
+        Config(),
+        str(index_path),
+        batch_size=4,
+        max_wait=0.05,
+        **kwargs,
+    )
+    pipeline.run()
+    return pipeline
+
+
+def test_pipeline_indexes_records(tmp_path):
+    pipeline = run_pipeline(tmp_path, StubService(25), StubEncoder())
+
+    store = EmbeddingStore(str(tmp_path))
+    assert pipeline.indexed == 25
+    assert sorted(store.keys, key=int) == [str(i) for i in range(25)]
+    assert store.record(store.keys.index("7"))["title"] == "Post 7"
+
+
+def test_pipeline_resumes_after_failure(tmp_path):
+    with pytest.raises(RuntimeError):
+        run_pipeline(tmp_path, StubService(25), StubEncoder(fail_on=3))
+
+    indexed = EmbeddingStore(str(tmp_path)).keys
+    assert 0 < len(indexed) < 25
+
+    pipeline = run_pipeline(tmp_path, StubService(25), StubEncoder())
+
+    keys = EmbeddingStore(str(tmp_path)).keys
+    assert keys[: len(indexed)] == indexed
+    assert sorted(keys, key=int) == [str(i) for i in range(25)]
+    assert pipeline.fetched == 25 - len(indexed)
+
+
+def test_pipeline_stop_indexes_fetched_records(tmp_path):
+    pipeline = StreamingPipeline(
+        StubService(None, delay=0.01),
+        Formatter(),
+        StubEncoder(),
+        Config(),
+        str(tmp_path),
+        batch_size=4,
+        max_wait=0.05,
+    )
+    threading.Timer(0.3, pipeline.stop).start()
+    result = pipeline.run()
+
+    assert 0 < result["fetched"] == result["indexed"]
+    assert len(EmbeddingStore(str(tmp_path))) == result["indexed"]
+
+
+def test_pipeline_failure_ends_polling(tmp_path):
+    pipeline = StreamingPipeline(
+        StubService(5),
+        Formatter(),
+        StubEncoder(fail_on=1),
+        Config(),
+        str(tmp_path),
+        interval=30,
+        batch_size=4,
+        max_wait=0.05,
+    )
+    errors = []
+
+    def run():
+        try:
+            pipeline.run()
+        except RuntimeError as e:
+            errors.append(e)
+
+    # The failure must end the interval wait instead of polling again
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert len(errors) == 1
+    assert pipeline.fetched <= 5
+
+
+def test_cascade_reaches_streamed_records(tmp_path, monkeypatch):
+    config = Config()
+    config.index_path = str(tmp_path / "index")
+    config.fast_index_path = str(tmp_path / "index_fast")
+    monkeypatch.setattr(
+        cognition.main, "EmbeddingEncoder", lambda *args, **kwargs: StubEncoder()
+    )
+
+    run_pipeline(config.index_path, StubService(10), StubEncoder())
+    cascade = cognition.main.build_cascade(config, [], Formatter(), reindex=False)
+    assert len(cascade.store) == 10
+
+    run_pipeline(config.index_path, StubService(15), StubEncoder())
+    cascade = cognition.main.build_cascade(config, [], Formatter(), reindex=False)
+    assert sorted(cascade.store.keys, key=int) == [str(i) for i in range(15)]
+    assert cascade.document(cascade.store.keys.index("12")).startswith(
+        "Title: $Post 12"
+    )
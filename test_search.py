@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from cognition.search import RetrievalCascade
+from cognition.store import EmbeddingStore
+
+
+class StubEncoder:
+    """Encodes a text as the vector registered for it."""
+
+    def __init__(self, vectors: dict[str, np.ndarray]):
+        self.vectors = vectors
+        self.encoded: list[str] = []
+
+    def encode(self, inputs, **kwargs):
+        inputs = [inputs] if isinstance(inputs, str) else inputs
+        self.encoded.extend(inputs)
+        return np.stack([self.vectors[text] for text in inputs])
+
+
+@pytest.fixture
+def corpus(normalized):
+    vectors = normalized(100, 16)
+    noisy = vectors + 0.2 * normalized(100, 16, seed=1)
+    return vectors, noisy / np.linalg.norm(noisy, axis=1, keepdims=True)
+
+
+def build_store(path, vectors: np.ndarray, rows) -> EmbeddingStore:
+    store = EmbeddingStore.create(str(path), vectors.shape[1], dtype="float16")
+    store.append(vectors[rows], keys=[str(row) for row in rows])
+    return store
+
+
+def test_cascade_reranks_candidates(tmp_path, corpus):
+    vectors, noisy = corpus
+    texts = {str(i): vector for i, vector in enumerate(vectors)}
+    store = build_store(tmp_path, noisy, np.arange(100))
+    cascade = RetrievalCascade(
+        StubEncoder(texts), StubEncoder(texts), store, str, candidates=20
+    )
+
+    results, timings = cascade.search("7", top_k=5)
+
+    exact = [float(vectors[row] @ vectors[7]) for row, _ in results]
+    assert results[0][0] == 7
+    assert [score for _, score in results] == pytest.approx(exact, abs=1e-5)
+    assert exact == sorted(exact, reverse=True)
+    assert set(timings) == {"candidates", "rerank"}
+
+
+def test_cascade_skips_rows_without_text(tmp_path, corpus):
+    vectors, _ = corpus
+    texts = {str(i): vector for i, vector in enumerate(vectors)}
+    reranker = StubEncoder(texts)
+    store = build_store(tmp_path, vectors, np.arange(100))
+    cascade = RetrievalCascade(
+        StubEncoder(texts),
+        reranker,
+        store,
+        lambda row: None if row == 7 else str(row),
+        candidates=10,
+    )
+
+    results, _ = cascade.search("7", top_k=5)
+    cascade.search("7", top_k=5)
+
+    assert cascade.missing == {7}
+    assert 7 not in [row for row, _ in results]
+    # The 9 candidate documents are encoded once; only the query is repeated
+    assert reranker.encoded.count("7") == 2
+    assert len(reranker.encoded) == 2 + 9
+
+
+def test_cascade_evaluate_matches_by_key(tmp_path, corpus):
+    vectors, _ = corpus
+    texts = {str(i): vector for i, vector in enumerate(vectors)}
+    encoder = StubEncoder(texts)
+    shuffled = np.random.default_rng(2).permutation(100)
+    fast_store = build_store(tmp_path / "fast", vectors, shuffled)
+    baseline_store = build_store(tmp_path / "base", vectors, np.arange(100))
+    cascade = RetrievalCascade(
+        encoder,
+        encoder,
+        fast_store,
+        lambda row: fast_store.keys[row],
+        candidates=20,
+    )
+
+    report = cascade.evaluate(["3", "42"], baseline_store, top_k=5)
+
+    assert report["recall"] == pytest.approx(1.0)
@@ -0,0 +1,81 @@
+import numpy as np
+
+from cognition.similarity import Neighbours, Pairs, SimilarityJoin
+from cognition.store import EmbeddingStore
+
+
+def build_store(path, vectors: np.ndarray) -> EmbeddingStore:
+    store = EmbeddingStore.create(str(path), vectors.shape[1], dtype="float16")
+    store.append(vectors, keys=[str(i) for i in range(len(vectors))])
+    return store
+
+
+def exact_scores(store: EmbeddingStore) -> np.ndarray:
+    vectors = store.vectors()
+    scores = vectors @ vectors.T
+    np.fill_diagonal(scores, -np.inf)
+    return scores
+
+
+def test_top_k_matches_brute_force(tmp_path, normalized):
+    store = build_store(tmp_path, normalized(300, 32))
+    neighbours = SimilarityJoin(store, block_size=64, workers=2).top_k(5)
+
+    expected = np.sort(exact_scores(store), axis=1)[:, ::-1][:, :5]
+    assert np.allclose(np.sort(neighbours.scores, axis=1)[:, ::-1], expected)
+    assert not (neighbours.ids == np.arange(300)[:, None]).any()
+
+
+def test_incremental_top_k_matches_full_recompute(tmp_path, normalized):
+    vectors = normalized(300, 32)
+    store = build_store(tmp_path, vectors[:200])
+    join = SimilarityJoin(store, block_size=64, workers=2)
+    neighbours = join.top_k(5)
+
+    store.append(vectors[200:], keys=[str(i) for i in range(200, 300)])
+    neighbours = join.top_k(5, neighbours)
+    full = join.top_k(5)
+
+    assert np.allclose(np.sort(neighbours.scores, axis=1), np.sort(full.scores, axis=1))
+    assert neighbours.to_table(store.keys) == full.to_table(store.keys)
+
+
+def test_neighbours_discarded_after_rebuild(tmp_path, normalized):
+    vectors = normalized(100, 16)
+    store = build_store(tmp_path / "index", vectors)
+    file_path = str(tmp_path / "related.npz")
+    SimilarityJoin(store).top_k(3).save(file_path)
+    assert len(Neighbours.load(file_path, 3, store)) == 100
+
+    store = build_store(tmp_path / "index", vectors[:50])
+
+    assert len(Neighbours.load(file_path, 3, store)) == 0
+
+
+def test_threshold_pairs_match_brute_force(tmp_path, normalized):
+    store = build_store(tmp_path, normalized(200, 8))
+    pairs = SimilarityJoin(store, block_size=64, workers=2).threshold_pairs(0.6)
+
+    rows, cols = np.nonzero(np.tril(exact_scores(store) >= 0.6, k=-1))
+    assert sorted(zip(pairs.rows.tolist(), pairs.cols.tolist())) == sorted(
+        zip(rows.tolist(), cols.tolist())
+    )
+
+    table = pairs.to_table(store.keys)
+    assert sum(len(related) for related in table.values()) == 2 * len(pairs)
+
+
+def test_incremental_threshold_pairs_match_full_recompute(tmp_path, normalized):
+    vectors = normalized(200, 8)
+    store = build_store(tmp_path / "index", vectors[:120])
+    join = SimilarityJoin(store, block_size=64)
+    file_path = str(tmp_path / "pairs.npz")
+    join.threshold_pairs(0.6).save(file_path)
+
+    store.append(vectors[120:], keys=[str(i) for i in range(120, 200)])
+    pairs = join.threshold_pairs(0.6, Pairs.load(file_path, 0.6, store))
+    full = join.threshold_pairs(0.6)
+
+    assert pairs.count == full.count == 200
+    assert pairs.to_table(store.keys) == full.to_table(store.keys)
+    assert Pairs.load(file_path, 0.7, store).count == 0
@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+
+from cognition.store import EmbeddingStore, QueryCache, quantize_int8
+
+
+def test_quantize_int8_round_trip(normalized):
+    vectors = normalized(100, 64)
+    codes, scales = quantize_int8(vectors)
+
+    assert codes.dtype == np.int8
+    assert np.abs(codes.astype(np.float32) * scales[:, None] - vectors).max() < 0.01
+
+
+def test_quantize_int8_zero_vector():
+    codes, scales = quantize_int8(np.zeros((1, 8), dtype=np.float32))
+
+    assert not codes.any()
+    assert scales[0] == 1.0
+
+
+@pytest.mark.parametrize("dtype", ["int8", "float16"])
+def test_search_matches_exact_ranking(tmp_path, dtype, normalized):
+    vectors = normalized(3000, 64)
+    store = EmbeddingStore.create(str(tmp_path), 64, dtype=dtype)
+    store.append(vectors[:1000], keys=[str(i) for i in range(1000)])
+    store.append(vectors[1000:], keys=[str(i) for i in range(1000, 3000)])
+
+    query = vectors[42] + 0.3 * normalized(1, 64, seed=1)[0]
+    expected = np.argsort(-(vectors @ query))[:10].tolist()
+
+    reopened = EmbeddingStore(str(tmp_path))
+    quantized = [row for row, _ in reopened.search(query, top_k=10, block_size=500)]
+    rescored = reopened.search(query, top_k=10, rescore=100, block_size=500)
+
+    assert len(reopened) == 3000
+    assert reopened.keys[-1] == "2999"
+    assert len(set(quantized) & set(expected)) >= 9
+    assert [row for row, _ in rescored] == expected
+    assert rescored[0][1] == pytest.approx(float(vectors[expected[0]] @ query))
+
+
+def test_vectors_dequantizes_rows(tmp_path, normalized):
+    vectors = normalized(50, 32)
+    store = EmbeddingStore.create(str(tmp_path), 32)
+    store.append(vectors)
+
+    assert np.abs(store.vectors(10, 20) - vectors[10:20]).max() < 0.01
+    assert store.vectors(60, 70).shape == (0, 32)
+
+
+def test_append_drops_unpublished_tail(tmp_path, normalized):
+    vectors = normalized(20, 16)
+    store = EmbeddingStore.create(str(tmp_path), 16)
+    store.append(vectors[:10], keys=[str(i) for i in range(10)])
+
+    # Simulate a crash after data was written but before meta was published
+    with open(store._file(EmbeddingStore.VECTORS_FILE), "ab") as f:
+        f.write(b"\x01" * 16 * 5)
+    with open(store._file(EmbeddingStore.KEYS_FILE), "a") as f:
+        f.write("lost\n")
+
+    store = EmbeddingStore(str(tmp_path))
+    store.append(vectors[10:], keys=[str(i) for i in range(10, 20)])
+
+    reopened = EmbeddingStore(str(tmp_path))
+    assert reopened.keys == [str(i) for i in range(20)]
+    assert np.abs(reopened.vectors() - vectors).max() < 0.01
+
+
+def test_records_are_stored_per_row(tmp_path, normalized):
+    store = EmbeddingStore.create(str(tmp_path), 8)
+    store.append(normalized(2, 8), records=[{"id": "a", "title": "Zażółć"}, {}])
+    store.append(normalized(1, 8))
+
+    # Simulate a crash after a record was written but before meta was published
+    with open(store._file(EmbeddingStore.RECORDS_FILE), "ab") as f:
+        f.write(b'{"id": "lost"}\n')
+
+    store = EmbeddingStore(str(tmp_path))
+    store.append(normalized(1, 8), records=[{"id": "d"}])
+
+    assert store.record(0) == {"id": "a", "title": "Zażółć"}
+    assert store.record(1) == {}
+    assert store.record(2) is None
+    assert store.record(3) == {"id": "d"}
+    assert store.record(4) is None
+
+
+def test_create_renews_generation(tmp_path, normalized):
+    first = EmbeddingStore.create(str(tmp_path), 8)
+    first.append(normalized(5, 8))
+    generation = first.generation
+
+    second = EmbeddingStore.create(str(tmp_path), 8)
+
+    assert len(second) == 0
+    assert second.generation != generation
+    assert not second.matches(generation, 0)
+    assert second.matches(second.generation, 0)
+
+
+def test_create_keeps_open_readers_working(tmp_path, normalized):
+    vectors = normalized(100, 16)
+    store = EmbeddingStore.create(str(tmp_path), 16)
+    store.append(vectors, keys=[str(i) for i in range(100)])
+    reader = EmbeddingStore(str(tmp_path))
+    assert reader.search(vectors[7], top_k=1)[0][0] == 7
+
+    rebuilt = EmbeddingStore.create(str(tmp_path), 16)
+    rebuilt.append(vectors[:10])
+
+    # The reader keeps its generation until it refreshes
+    assert reader.search(vectors[42], top_k=1)[0][0] == 42
+    with pytest.raises(ValueError):
+        store.append(vectors[:1])
+
+    reader.refresh()
+    assert len(reader) == 10
+    assert reader.generation == rebuilt.generation
+    assert reader.search(vectors[7], top_k=1)[0][0] == 7
+
+
+def test_create_removes_old_generations(tmp_path):
+    first = EmbeddingStore.create(str(tmp_path), 8)
+    second = EmbeddingStore.create(str(tmp_path), 8)
+    third = EmbeddingStore.create(str(tmp_path), 8)
+
+    assert not (tmp_path / first.generation).exists()
+    assert (tmp_path / second.generation).exists()
+    assert (tmp_path / third.generation).exists()
+
+
+def test_append_rejects_wrong_dimension(tmp_path, normalized):
+    store = EmbeddingStore.create(str(tmp_path), 8)
+
+    with pytest.raises(ValueError):
+        store.append(normalized(2, 4))
+
+
+def test_query_cache_is_keyed_by_model(tmp_path):
+    path = str(tmp_path / "queries.npz")
+    QueryCache(path, "model-a").put("Biznes", np.ones((1, 4)))
+
+    assert QueryCache(path, "model-a").get("Biznes").tolist() == [1, 1, 1, 1]
+    assert QueryCache(path, "model-b").get("Biznes") is None